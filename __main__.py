@@ -0,0 +1,11 @@
+"""
+Allow the documentation generator to be run as ``python <repo dir>``.
+"""
+import sys
+
+
+from documentation_generator import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,18 +4,48 @@ Documentation Generator - A tool to generate documentation from Python source co
 
 This module serves as the entry point for the documentation generator tool.
 """
+from concurrent.futures import ProcessPoolExecutor
+import glob
 import logging
+import os
 import sys
+import traceback
+from typing import Any, Dict, Optional, Tuple
 
 
-from utils.cli import parse_args
+from utils.cli import compile_ignore_matcher, parse_args
 from utils.file_processor import FileProcessor
 from utils.parser import CodeParser
-from utils.generator import DocumentationGenerator
+from utils.generator import MP_CONTEXT, DocumentationGenerator
 from utils.writer import OutputWriter
 from utils.logger import logger
 
 
+# Inputs with fewer files than this are parsed in-process, since starting worker processes would cost more than it saves.
+PARALLEL_PARSE_THRESHOLD: int = 8
+
+
+def _parse_one(item: Tuple[str, str]) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Parse a single file. Defined at module level so worker processes can unpickle it.
+    
+    Inheritance is not resolved here, because it depends on classes from other files.
+    
+    Args:
+        item: Tuple of (file path, docstring style)
+    
+    Returns:
+        Tuple of (file path, parsed file information or None, formatted traceback if parsing failed)
+    """
+    file_path, docstring_style = item
+    try:
+        result = CodeParser().parse(file_path, docstring_style=docstring_style, resolve_inheritance=False)
+    except Exception:
+        # Report the failure instead of raising, so one bad file doesn't abort the other workers
+        return file_path, None, traceback.format_exc()
+    return file_path, result, None
+
+
 def main() -> int:
     """
     Main entry point for the documentation generator.
@@ -29,8 +59,14 @@ def main() -> int:
     if args.verbose:
         logger.setLevel(logging.DEBUG)
 
-    # Process input files
-    file_processor = FileProcessor(args.input)
+    # Process input files. FileProcessor matches plain ignore paths itself, by
+    # prefix and by inode, so only glob patterns need the compiled matcher.
+    glob_ignores = [path for path in args.ignore if glob.has_magic(path)]
+    file_processor = FileProcessor(
+        args.input,
+        ignore_paths=args.ignore,
+        is_ignored=compile_ignore_matcher(glob_ignores) if glob_ignores else None
+    )
     python_files = file_processor.find_python_files()
     
     # Parse source code
@@ -38,24 +74,31 @@ def main() -> int:
     parsed_files = {}
     
     logger.info(f"Processing {len(python_files)} Python files...")
-    for file_path in python_files:
-        try:
-            # Enable inheritance resolution if the option is specified
-            inheritance_enabled = getattr(args, 'inheritance', False)
-            result = parser.parse(
-                file_path, 
-                docstring_style=args.docstring_style,
-                resolve_inheritance=inheritance_enabled
-            )
-            parsed_files[file_path] = result
+    items = [(file_path, args.docstring_style) for file_path in python_files]
+    if len(items) < PARALLEL_PARSE_THRESHOLD:
+        results = list(map(_parse_one, items))
+    else:
+        # Parsing is CPU-bound, so spread it across processes
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, mp_context=MP_CONTEXT) as executor:
+            results = list(executor.map(_parse_one, items, chunksize=max(1, len(items) // (4 * workers))))
             
-            logger.debug(f"Processed: {file_path}")
-        except Exception as e:
-            logger.exception(f"Error processing {file_path}: {str(e)}", file=sys.stderr)
+    # Enable inheritance resolution if the option is specified
+    inheritance_enabled = getattr(args, 'inheritance', False)
+    
+    # Register classes in input order, so inheritance resolves as if files were parsed one by one
+    for file_path, result, error in results:
+        if error is not None:
+            logger.error(f"Error processing {file_path}:\n{error}")
+            continue
+        
+        parser.add_parsed_file(result, resolve_inheritance=inheritance_enabled)
+        parsed_files[file_path] = result
+        
+        logger.debug(f"Processed: {file_path}")
     
     # Generate documentation
-    generator = DocumentationGenerator(parsed_files)
-    documentation = generator.generate(format=args.format)
+    generator = DocumentationGenerator(parsed_files, cache_dir=args.cache_dir)
     
     # Handle self-documentation mode
     self_doc_mode = getattr(args, 'self_doc', False)
@@ -64,13 +107,13 @@ def main() -> int:
         logger.info("Running in self-documentation mode...")
         # In self-documentation mode, we might want to add special headers or metadata
         
-    # Write output
+    # Write output, streaming each page to disk as it is rendered
     writer = OutputWriter(args.output)
-    writer.write(documentation)
+    writer.write(generator.iter_generate(format=args.format))
     
     logger.info(f"Documentation generated successfully in {args.output}")
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,21 @@
+"""
+Constant test data shared by the test modules.
+"""
+
+# Completion returned by the mocked OpenAI client for generation prompts
+CANNED_GHERKIN = """Feature: Test Feature
+  As a user
+  I want to test
+  So that it works
+
+  Background:
+    Given the callable 'test' with signature ()
+    And the callable is accessible through the public API
+
+  Scenario: Test scenario
+    Given test inputs
+    When I call test
+    Then it should return a dictionary with keys: status, data"""
+
+# Completion returned by the mocked OpenAI client for the clarity classifier
+CANNED_CLASSIFICATION = '{"is_clear": true, "issues": []}'
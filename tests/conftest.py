@@ -2,8 +2,14 @@
 Pytest configuration and shared fixtures for make_gherkins tests.
 """
 
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
 import pytest
-from unittest.mock import Mock, patch
+
+
+from utils import GherkinGenerator, GherkinMetadata
+from tests._data import CANNED_CLASSIFICATION, CANNED_GHERKIN
 
 
 class FixtureError(RuntimeError):
@@ -11,41 +17,76 @@ class FixtureError(RuntimeError):
     pass
 
 
-@pytest.fixture(scope="session")
-def mock_openai_api():
-    """
-    Mock OpenAI API for testing without making actual API calls.
+@dataclass(frozen=True)
+class _Message:
+    """Message of a chat completion choice."""
+    content: str
+
+
+@dataclass(frozen=True)
+class _Choice:
+    """Single choice of a chat completion."""
+    message: _Message
+
+
+@dataclass(frozen=True)
+class _Response:
+    """Chat completion response, shaped like the parts of the OpenAI response that are read."""
+    choices: Tuple[_Choice, ...]
+
+
+@dataclass(frozen=True)
+class _Completions:
+    """Stands in for client.chat.completions, returning canned responses."""
+    response: _Response
+    classification: _Response
     
-    This fixture should be used to mock OpenAI responses in tests
-    to avoid API costs and network dependencies.
+    def create(self, **kwargs: Any) -> _Response:
+        # The clarity classifier expects JSON rather than Gherkin
+        if "classifier" in kwargs["messages"][0]["content"]:
+            return self.classification
+        return self.response
+
+
+@dataclass(frozen=True)
+class _Chat:
+    """Stands in for client.chat."""
+    completions: _Completions
+
+
+@dataclass(frozen=True)
+class _FakeClient:
+    """Minimal stand-in for openai.OpenAI, without Mock's attribute and call tracking."""
+    chat: _Chat
+
+
+# The fake client is constant, so it is built once at import rather than per session
+_CANNED_RESPONSE = _Response(choices=(_Choice(_Message(CANNED_GHERKIN)),))
+_CANNED_CLASSIFICATION = _Response(choices=(_Choice(_Message(CANNED_CLASSIFICATION)),))
+_FAKE_CLIENT = _FakeClient(_Chat(_Completions(_CANNED_RESPONSE, _CANNED_CLASSIFICATION)))
+
+
+def _fake_openai(**kwargs: Any) -> _FakeClient:
+    """
+    Replacement for the OpenAI class, returning the shared fake client.
     """
-    with patch('utils.gherkin_generator.OpenAI') as mock_openai:
-        # Create mock response for chat completions
-        mock_response = Mock()
-        mock_response.choices = [Mock()]
-        mock_response.choices[0].message = Mock()
-        mock_response.choices[0].message.content = """Feature: Test Feature
-  As a user
-  I want to test
-  So that it works
+    return _FAKE_CLIENT
 
-  Background:
-    Given the callable 'test' with signature ()
-    And the callable is accessible through the public API
 
-  Scenario: Test scenario
-    Given test inputs
-    When I call test
-    Then it should return a dictionary with keys: status, data"""
-        
-        mock_client = Mock()
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_openai.return_value = mock_client
-        
-        yield mock_openai
+@pytest.fixture(scope="session", autouse=True)
+def _force_mock_openai():
+    """
+    Mock OpenAI API for every test, without making actual API calls.
+    
+    The real client is never wanted in tests, so the mock is installed once
+    for the whole session instead of being patched in and out per test.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('utils.gherkin_generator.OpenAI', _fake_openai)
+        yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_key():
     """
     Provide API key for testing.
@@ -55,9 +96,210 @@ def api_key():
     return "test-api-key-12345"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def max_iterations():
     """
     Default max iterations for testing.
     """
     return 3
+
+
+@pytest.fixture(scope="session")
+def gherkin_generator(api_key, max_iterations):
+    """
+    Fixture to provide a GherkinGenerator instance with mocked OpenAI API.
+    
+    Shared by the whole session, since the generator keeps no per-call state.
+    """
+    try:
+        return GherkinGenerator(api_key=api_key, max_iterations=max_iterations)
+    except Exception as e:
+        raise FixtureError(f"Failed to create GherkinGenerator fixture: {e}")
+
+
+@pytest.fixture(scope="session")
+def gherkin_results(gherkin_generator):
+    """
+    Memoized make_gherkins, shared by the whole session.
+    
+    The OpenAI client is mocked, so make_gherkins is deterministic for a given
+    callable and each sample callable only needs to be generated once, all by
+    the session's shared generator.
+    
+    Returns a function taking a callable and returning its (content, metadata).
+    """
+    # Keep a reference to each callable so its id can't be reused by another object
+    results: Dict[int, Tuple[Callable, Tuple[str, GherkinMetadata]]] = {}
+    
+    def generate(callable_obj: Callable) -> Tuple[str, GherkinMetadata]:
+        key = id(callable_obj)
+        if key not in results:
+            results[key] = (callable_obj, gherkin_generator.make_gherkins(callable_obj))
+        return results[key][1]
+    
+    return generate
+
+
+# Sample callables are defined once at import; the fixtures below hand out references to them
+
+
+def add_numbers(a: int, b: int) -> int:
+    """Add two numbers together.
+    
+    Args:
+        a: First number
+        b: Second number
+    
+    Returns:
+        int: Sum of a and b
+    """
+    return a + b
+
+
+def process_data(name: str, age: int, email: str, active: bool) -> dict:
+    """Process user data with multiple parameters.
+    
+    Args:
+        name: User's full name
+        age: User's age in years
+        email: User's email address
+        active: Whether user account is active
+    
+    Returns:
+        dict: Processed user data
+    """
+    return {"name": name, "age": age, "email": email, "active": active}
+
+
+def multiply(x: int, y: int) -> int:
+    """Multiply two numbers.
+    
+    Args:
+        x: First number
+        y: Second number
+    
+    Returns:
+        int: Product of x and y
+    
+    Examples:
+        multiply(2, 3)  # Returns 6
+        multiply(5, 4)  # Returns 20
+        multiply(0, 10) # Returns 0
+    """
+    return x * y
+
+
+class Calculator:
+    """A simple calculator class."""
+    
+    def __init__(self, precision: int = 2):
+        """Initialize calculator.
+        
+        Args:
+            precision: Decimal places for rounding
+        """
+        self.precision = precision
+    
+    def divide(self, a: float, b: float) -> float:
+        """Divide two numbers with precision.
+        
+        Args:
+            a: Numerator
+            b: Denominator
+        
+        Returns:
+            float: Result of division rounded to precision
+        
+        Raises:
+            ZeroDivisionError: If b is zero
+        """
+        return round(a / b, self.precision)
+
+
+def no_docs(x):
+    return x * 2
+
+
+def complete_function(data: list, threshold: int = 10) -> dict:
+    """Process a list of data with comprehensive documentation.
+    
+    This function filters and processes data based on a threshold value.
+    It returns a dictionary with statistics and filtered results.
+    
+    Args:
+        data: List of integer values to process
+        threshold: Minimum value to include (default: 10)
+    
+    Returns:
+        dict: Dictionary containing:
+            - count: Number of items above threshold
+            - sum: Sum of filtered items
+            - items: List of filtered items
+    
+    Raises:
+        TypeError: If data is not a list
+        ValueError: If threshold is negative
+    
+    Examples:
+        complete_function([5, 15, 20], 10)  # Returns {'count': 2, 'sum': 35, 'items': [15, 20]}
+        complete_function([1, 2, 3], 0)     # Returns {'count': 3, 'sum': 6, 'items': [1, 2, 3]}
+    """
+    if not isinstance(data, list):
+        raise TypeError("data must be a list")
+    if threshold < 0:
+        raise ValueError("threshold must be non-negative")
+    
+    filtered = [x for x in data if x >= threshold]
+    return {
+        "count": len(filtered),
+        "sum": sum(filtered),
+        "items": filtered
+    }
+
+
+@pytest.fixture(scope="session")
+def simple_function():
+    """
+    Fixture providing a simple function with a docstring containing description, parameters, and returns.
+    """
+    return add_numbers
+
+
+@pytest.fixture(scope="session")
+def function_with_multiple_parameters():
+    """
+    Fixture providing a callable with multiple documented parameters.
+    """
+    return process_data
+
+
+@pytest.fixture(scope="session")
+def function_with_examples():
+    """
+    Fixture providing a callable with docstring examples.
+    """
+    return multiply
+
+
+@pytest.fixture(scope="session")
+def class_method_with_docstring():
+    """
+    Fixture providing a class method with a comprehensive docstring.
+    """
+    return Calculator().divide
+
+
+@pytest.fixture(scope="session")
+def callable_without_docstring():
+    """
+    Fixture providing a callable without a docstring.
+    """
+    return no_docs
+
+
+@pytest.fixture(scope="session")
+def callable_with_complete_docstring():
+    """
+    Fixture providing a callable with a complete docstring.
+    """
+    return complete_function
@@ -0,0 +1,120 @@
+"""
+Tests for the command-line interface helpers.
+"""
+
+import argparse
+import os
+
+import pytest
+
+
+from utils.cli import (
+    compile_ignore_matcher, docs_subdir, existing_path, load_ignore_paths, parse_args, save_ignore_paths
+)
+
+
+
+def test_existing_path_accepts_existing_path(tmp_path):
+    """
+    Given a path that exists
+    When I validate it with existing_path
+    Then the path should be returned unchanged
+    """
+    assert existing_path(str(tmp_path)) == str(tmp_path), "Expected an existing path to be accepted"
+
+
+def test_existing_path_rejects_missing_path(tmp_path):
+    """
+    Given a path that does not exist
+    When I validate it with existing_path
+    Then an ArgumentTypeError should be raised
+    """
+    with pytest.raises(argparse.ArgumentTypeError):
+        existing_path(str(tmp_path / "missing"))
+
+
+def test_docs_subdir_places_output_in_docs_directory():
+    """
+    Given an output path from the command line
+    When I convert it with docs_subdir
+    Then the docs subdirectory of the path should be returned
+    """
+    assert docs_subdir("build") == os.path.join("build", "docs"), "Expected output to go to a docs subdirectory"
+
+
+def test_parse_args_applies_argument_types(tmp_path, monkeypatch):
+    """
+    Given an existing input path and an output path on the command line
+    When I parse the arguments
+    Then the input should be kept and the output should point at its docs subdirectory
+    """
+    monkeypatch.setattr("sys.argv", ["documentation_generator", "--input", str(tmp_path), "--output", "build"])
+    args = parse_args()
+
+    assert (args.input, args.output) == (str(tmp_path), os.path.join("build", "docs")), \
+        f"Expected the argument types to be applied, but got {args}"
+
+
+def test_parse_args_rejects_missing_input(tmp_path, monkeypatch):
+    """
+    Given an input path that does not exist on the command line
+    When I parse the arguments
+    Then parsing should exit with a usage error
+    """
+    monkeypatch.setattr("sys.argv", ["documentation_generator", "--input", str(tmp_path / "missing")])
+
+    with pytest.raises(SystemExit):
+        parse_args()
+
+
+@pytest.mark.parametrize("path,expected", [
+    ("build", True),
+    ("build/lib/module.py", True),
+    ("src/test_module.py", True),
+    ("src/module.py", False),
+    ("builder.py", False),
+], ids=["ignored_directory", "below_ignored_directory", "glob_match", "no_match", "shared_prefix_only"])
+def test_compiled_matcher_matches_absolute_paths(path, expected, tmp_path):
+    """
+    Given a matcher compiled from a plain ignore path and a glob pattern
+    When I check an absolute path with it
+    Then only the ignored paths, and the paths below them, should match
+    """
+    is_ignored = compile_ignore_matcher([str(tmp_path / "build"), str(tmp_path / "src" / "test_*")])
+    
+    assert is_ignored(os.path.join(str(tmp_path), path)) is expected, \
+        f"Expected {path} to be ignored: {expected}"
+
+
+def test_load_ignore_paths_skips_blank_and_comment_lines(tmp_path):
+    """
+    Given an ignore file with blank lines, comments and indented paths
+    When I load it with load_ignore_paths
+    Then only the stripped paths should be returned, in file order
+    """
+    ignore_file = tmp_path / ".docignore"
+    ignore_file.write_text("# generated\n\nbuild\n  tests/fixtures  \n\t# indented comment\r\nvendor\n")
+    
+    assert load_ignore_paths(str(ignore_file)) == ["build", "tests/fixtures", "vendor"], \
+        "Expected blank and comment lines to be skipped"
+
+
+def test_load_ignore_paths_returns_empty_list_for_missing_file(tmp_path):
+    """
+    Given an ignore file path that does not exist
+    When I load it with load_ignore_paths
+    Then an empty list should be returned
+    """
+    assert load_ignore_paths(str(tmp_path / "missing")) == [], "Expected no ignore paths for a missing file"
+
+
+def test_saved_ignore_paths_load_back_unchanged(tmp_path):
+    """
+    Given a list of ignore paths saved with save_ignore_paths
+    When I load the file with load_ignore_paths
+    Then the same paths should be returned
+    """
+    paths = ["build", "src/test_*", "docs/generated"]
+    save_ignore_paths(str(tmp_path / ".docignore"), paths)
+    
+    assert load_ignore_paths(str(tmp_path / ".docignore")) == paths, "Expected saved ignore paths to load back unchanged"
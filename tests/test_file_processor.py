@@ -0,0 +1,223 @@
+"""
+Tests for FileProcessor.
+"""
+
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+from utils import file_processor as file_processor_module
+from utils.cli import compile_ignore_matcher
+from utils.file_processor import FileProcessor
+
+
+
+# Fixtures
+@pytest.fixture
+def project(tmp_path):
+    """
+    Fixture providing a project directory with Python files at the top level and in a subdirectory.
+    
+    Returns the project directory.
+    """
+    root = tmp_path / "proj"
+    (root / "sub").mkdir(parents=True)
+    (root / "top.py").write_text("")
+    (root / "sub" / "m.py").write_text("")
+    return root
+
+
+@pytest.fixture
+def scan_cache(monkeypatch):
+    """
+    Fixture giving the test an empty scan cache.
+    """
+    monkeypatch.setattr(file_processor_module, "_SCAN_CACHE", OrderedDict())
+
+
+@pytest.fixture
+def count_scans(monkeypatch):
+    """
+    Fixture counting the directories listed by FileProcessor.
+    
+    Returns a list that gains each directory as it is listed.
+    """
+    listed = []
+    scan_dir = FileProcessor._scan_dir
+    
+    def counting_scan_dir(self, directory, abs_directory):
+        listed.append(directory)
+        return scan_dir(self, directory, abs_directory)
+    
+    monkeypatch.setattr(FileProcessor, "_scan_dir", counting_scan_dir)
+    return listed
+
+
+def _age_directories(root, seconds=60):
+    """
+    Set the mtime of a directory and every directory below it to the given number of seconds ago.
+    """
+    past = os.stat(root).st_mtime - seconds
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, (past, past))
+
+
+def _new_processor(project):
+    """
+    Create a FileProcessor the way main() does, with a newly compiled glob matcher.
+    """
+    return FileProcessor(
+        str(project),
+        ignore_paths=[str(project / "build")],
+        is_ignored=compile_ignore_matcher([str(project / "test_*")])
+    )
+
+
+def test_unchanged_tree_is_served_from_scan_cache(project, scan_cache, count_scans):
+    """
+    Given a scanned directory tree that has not changed for longer than the racy window
+    When a new FileProcessor with equal ignore settings scans it again
+    Then the files should be returned without listing any directory
+    """
+    _age_directories(project)
+    expected = _new_processor(project).find_python_files()
+    count_scans.clear()
+    
+    assert (_new_processor(project).find_python_files(), count_scans) == (expected, []), \
+        "Expected the second scan to be served from the cache"
+
+
+def test_changed_directory_mtime_invalidates_scan_cache(project, scan_cache):
+    """
+    Given a cached scan of a directory tree that has not changed for longer than the racy window
+    When a file is added to a subdirectory and the tree is scanned again
+    Then the new file should be found
+    """
+    _age_directories(project)
+    _new_processor(project).find_python_files()
+    (project / "sub" / "new.py").write_text("")
+    _age_directories(project, seconds=30)
+    
+    assert os.path.join(str(project), "sub", "new.py") in _new_processor(project).find_python_files(), \
+        "Expected a changed directory mtime to invalidate the cached scan"
+
+
+def test_recently_changed_tree_is_rescanned(project, scan_cache, count_scans):
+    """
+    Given a scanned directory tree changed within the racy window before the scan
+    When it is scanned again
+    Then the directories should be listed again, as a change in the same mtime tick could be missed
+    """
+    _new_processor(project).find_python_files()
+    count_scans.clear()
+    _new_processor(project).find_python_files()
+    
+    assert count_scans, "Expected a recently changed tree to be rescanned"
+
+
+def test_concurrent_scans_share_scan_cache(tmp_path, scan_cache, monkeypatch):
+    """
+    Given more directory trees than the scan cache holds
+    When I find their Python files from several threads at once, repeatedly
+    Then every scan should return its own tree's files
+    """
+    monkeypatch.setattr(file_processor_module, "_SCAN_CACHE_SIZE", 2)
+    roots = []
+    for i in range(8):
+        root = tmp_path / f"tree_{i}"
+        root.mkdir()
+        (root / f"module_{i}.py").write_text("")
+        roots.append(root)
+    _age_directories(tmp_path)
+    
+    def scan(root):
+        return FileProcessor(str(root)).find_python_files()
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(scan, roots * 25))
+    
+    assert results == [[os.path.join(str(root), f"module_{i}.py")] for i, root in enumerate(roots)] * 25, \
+        "Expected concurrent scans to return their own files"
+
+
+@pytest.mark.parametrize("parallel", [False, True], ids=["serial", "parallel"])
+def test_ignore_path_symlinked_from_outside_input_is_skipped(parallel, project, tmp_path):
+    """
+    Given an ignore path outside the input directory that is a symlink to one of its subdirectories
+    When I find the Python files in the input directory
+    Then the files in that subdirectory should be skipped
+    """
+    (tmp_path / "out").mkdir()
+    os.symlink(project / "sub", tmp_path / "out" / "link")
+    processor = FileProcessor(str(project), ignore_paths=[str(tmp_path / "out" / "link")], parallel=parallel)
+    
+    assert processor.find_python_files() == [os.path.join(str(project), "top.py")], \
+        "Expected the subdirectory reached through the symlinked ignore path to be skipped"
+
+
+def test_should_ignore_path_below_ignore_path_outside_input(project, tmp_path):
+    """
+    Given an ignore path outside the input directory
+    When I check a path below the ignore path with should_ignore
+    Then the path should be ignored
+    """
+    processor = FileProcessor(str(project), ignore_paths=[str(tmp_path / "tests")])
+    
+    assert processor.should_ignore(str(tmp_path / "tests" / "t.py")), \
+        "Expected a path below an ignore path outside the input directory to be ignored"
+
+
+def test_plain_ignore_paths_and_glob_matcher_are_both_applied(project):
+    """
+    Given a plain ignore path and a compiled matcher covering only a glob pattern
+    When I find the Python files in the input directory
+    Then files excluded by either should be skipped
+    """
+    (project / "test_top.py").write_text("")
+    processor = FileProcessor(
+        str(project),
+        ignore_paths=[str(project / "sub")],
+        is_ignored=compile_ignore_matcher([str(project / "test_*")])
+    )
+    
+    assert processor.find_python_files() == [os.path.join(str(project), "top.py")], \
+        "Expected both the plain ignore path and the glob pattern to be applied"
+
+
+def test_small_tree_is_scanned_without_thread_pool(project, monkeypatch):
+    """
+    Given a directory tree with fewer directories than the parallel threshold
+    When I find its Python files with parallel scanning enabled
+    Then no thread pool should be started
+    """
+    def no_pool(*args, **kwargs):
+        raise AssertionError("thread pool started")
+    
+    monkeypatch.setattr(file_processor_module, "ThreadPoolExecutor", no_pool)
+    
+    assert len(FileProcessor(str(project), parallel=True).find_python_files()) == 2, \
+        "Expected a small tree to be scanned in the calling thread"
+
+
+@pytest.mark.parametrize("threshold", [0, 1, 3], ids=["pool_from_start", "pool_after_root", "pool_midway"])
+def test_scan_moving_to_thread_pool_keeps_serial_order(threshold, tmp_path, monkeypatch, scan_cache):
+    """
+    Given a nested directory tree and a parallel threshold below its directory count
+    When I find its Python files with parallel scanning enabled
+    Then the files should be found in the same order as a serial scan
+    """
+    root = tmp_path / "tree"
+    for path in ["a/b/c", "a/d", "e/f", "g"]:
+        (root / path).mkdir(parents=True)
+    for directory, _, _ in os.walk(root):
+        for name in ["x.py", "y.py"]:
+            open(os.path.join(directory, name), "w").close()
+    serial = FileProcessor(str(root), parallel=False).find_python_files()
+    file_processor_module._SCAN_CACHE.clear()
+    monkeypatch.setattr(FileProcessor, "PARALLEL_DIR_THRESHOLD", threshold)
+    
+    assert FileProcessor(str(root), parallel=True).find_python_files() == serial, \
+        "Expected the parallel scan to keep the serial scan's order"
@@ -0,0 +1,408 @@
+"""
+Tests for DocumentationGenerator.
+
+Source files are written to a temporary directory and parsed with CodeParser,
+so the generator sees the same parsed information as in a real run.
+"""
+
+import textwrap
+
+import pytest
+
+
+from utils import generator as generator_module
+from utils.generator import DocumentationGenerator
+from utils.parser import CodeParser
+
+
+
+# Fixtures
+@pytest.fixture
+def parse_source(tmp_path):
+    """
+    Fixture writing Python source to a file and parsing it.
+
+    Returns a function taking a file name, its source and optionally a
+    docstring style, and returning the file's path and parsed information.
+    """
+    parser = CodeParser()
+
+    def parse(name, source, docstring_style="google"):
+        path = tmp_path / "src" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(textwrap.dedent(source))
+        return str(path), parser.parse(str(path), docstring_style=docstring_style)
+
+    return parse
+
+
+@pytest.fixture
+def fixed_timestamp(monkeypatch):
+    """
+    Fixture removing the generation time from page titles, so runs can be compared.
+    """
+    monkeypatch.setattr(DocumentationGenerator, "_format_datetime_string", staticmethod(lambda: ""))
+
+
+@pytest.fixture
+def count_renders(monkeypatch):
+    """
+    Fixture counting the files rendered in this process.
+    
+    Returns a list that gains the path of each file as it is rendered.
+    """
+    rendered = []
+    render_file = generator_module._render_file
+    
+    def counting_render_file(item):
+        rendered.append(item[0])
+        return render_file(item)
+    
+    monkeypatch.setattr(generator_module, "_render_file", counting_render_file)
+    return rendered
+
+
+@pytest.fixture
+def greeter_file(parse_source):
+    """
+    Fixture providing a parsed file with a documented function and class.
+    """
+    return parse_source("greeter.py", '''
+        """Greeting helpers."""
+
+
+        def greet(name: str, punctuation: str = "!") -> str:
+            """Greet someone.
+
+            Args:
+                name: Who to greet
+                punctuation: Mark to end the greeting with
+
+            Returns:
+                str: The greeting
+            """
+            return f"Hello, {name}{punctuation}"
+
+
+        class Greeter:
+            """Greets people.
+
+            Attributes:
+                greeting: Word to greet with
+            """
+
+            def __init__(self, greeting: str = "Hello"):
+                """Create a greeter.
+
+                Args:
+                    greeting: Word to greet with
+                """
+                self.greeting = greeting
+
+            @classmethod
+            def default(cls, loud: bool = False):
+                """Build the default greeter.
+
+                Args:
+                    loud: Whether to shout
+                """
+                return cls()
+        ''')
+
+
+def test_generation_leaves_parsed_files_unmodified(greeter_file):
+    """
+    Given parsed information for a file
+    When I generate documentation from it
+    Then the parsed information should not gain any keys
+    """
+    file_path, file_info = greeter_file
+    function_keys = set(file_info["functions"][0])
+    class_keys = set(file_info["classes"][0])
+
+    DocumentationGenerator({file_path: file_info}).generate()
+
+    assert (set(file_info["functions"][0]), set(file_info["classes"][0])) == (function_keys, class_keys), \
+        "Expected generation to leave the parsed information unmodified"
+
+
+def test_file_added_after_first_generation_is_documented(greeter_file, parse_source):
+    """
+    Given a generator that has already generated documentation
+    When I add a newly parsed file and generate again
+    Then the new file should be documented
+    """
+    file_path, file_info = greeter_file
+    parsed_files = {file_path: file_info}
+    generator = DocumentationGenerator(parsed_files)
+    generator.generate()
+
+    new_path, new_info = parse_source("farewell.py", '''
+        def farewell(name: str) -> str:
+            """Say goodbye."""
+            return f"Bye, {name}"
+        ''')
+    parsed_files[new_path] = new_info
+    docs = generator.generate()
+
+    assert "## `farewell`" in docs["farewell.md"], f"Expected the added file to be documented, but got {docs}"
+
+
+def test_file_changed_in_place_is_rendered_from_new_signature(greeter_file):
+    """
+    Given a generator that has already generated documentation
+    When I change a parsed function's parameters in place and generate again
+    Then the documentation should show the new signature
+    """
+    file_path, file_info = greeter_file
+    generator = DocumentationGenerator({file_path: file_info})
+    generator.generate()
+
+    file_info["functions"][0]["params"].pop()
+    docs = generator.generate()
+
+    assert "def greet(name)\n" in docs["greeter.md"], \
+        f"Expected the signature to be rendered from the changed parameters\n{docs['greeter.md']}"
+
+
+def test_cached_page_is_reused_by_a_new_generator(greeter_file, tmp_path, fixed_timestamp, count_renders):
+    """
+    Given documentation generated with an on-disk cache directory
+    When a new generator with the same cache directory generates it again
+    Then the same documentation should be returned without rendering the file
+    """
+    file_path, file_info = greeter_file
+    first = DocumentationGenerator({file_path: file_info}, cache_dir=str(tmp_path / "cache")).generate()
+    count_renders.clear()
+    second = DocumentationGenerator({file_path: file_info}, cache_dir=str(tmp_path / "cache")).generate()
+    
+    assert (second, count_renders) == (first, []), "Expected the page to be served from the on-disk cache"
+
+
+def test_cache_format_version_change_rerenders_pages(greeter_file, tmp_path, monkeypatch, count_renders):
+    """
+    Given a page cached on disk by a generator with an older cache format version
+    When a generator with a newer cache format version generates it
+    Then the file should be rendered again
+    """
+    file_path, file_info = greeter_file
+    DocumentationGenerator({file_path: file_info}, cache_dir=str(tmp_path / "cache")).generate()
+    count_renders.clear()
+    monkeypatch.setattr(DocumentationGenerator, "CACHE_FORMAT_VERSION", "old")
+    DocumentationGenerator({file_path: file_info}, cache_dir=str(tmp_path / "cache")).generate()
+    
+    assert count_renders == [file_path], "Expected a cache format version change to invalidate cached pages"
+
+
+@pytest.mark.parametrize("corrupt", [
+    lambda entry: entry.write_bytes(b"\xff\xfe not utf-8"),
+    lambda entry: (entry.unlink(), entry.mkdir()),
+], ids=["undecodable", "unreadable"])
+def test_bad_cache_entry_is_rerendered(corrupt, greeter_file, tmp_path, fixed_timestamp):
+    """
+    Given a page cache entry that cannot be read back
+    When a new generator with the same cache directory generates the page
+    Then the page should be rendered again
+    """
+    file_path, file_info = greeter_file
+    cache_dir = tmp_path / "cache"
+    expected = DocumentationGenerator({file_path: file_info}, cache_dir=str(cache_dir)).generate()
+    corrupt(next(cache_dir.glob("*.md")))
+    docs = DocumentationGenerator({file_path: file_info}, cache_dir=str(cache_dir)).generate()
+    
+    assert docs == expected, "Expected an unreadable cache entry to be ignored"
+
+
+def test_unwritable_cache_directory_does_not_fail_generation(greeter_file, tmp_path, fixed_timestamp):
+    """
+    Given a cache directory path that is an existing file
+    When I generate documentation with it
+    Then the documentation should be generated as without a cache
+    """
+    file_path, file_info = greeter_file
+    (tmp_path / "cache").write_text("not a directory")
+    docs = DocumentationGenerator({file_path: file_info}, cache_dir=str(tmp_path / "cache")).generate()
+    
+    assert docs == DocumentationGenerator({file_path: file_info}).generate(), \
+        "Expected a failed cache write to leave the generated documentation unchanged"
+
+
+def test_parallel_rendering_matches_serial_rendering(parse_source, monkeypatch, fixed_timestamp):
+    """
+    Given parsed information for several files
+    When I generate documentation with rendering spread across worker processes
+    Then the documentation should match rendering in this process
+    """
+    parsed_files = dict(
+        parse_source(f"module_{i}.py", f'''
+            def function_{i}(value: int) -> int:
+                """Return the value plus {i}."""
+                return value + {i}
+            ''')
+        for i in range(3)
+    )
+    serial = DocumentationGenerator(parsed_files).generate()
+    monkeypatch.setattr(DocumentationGenerator, "PARALLEL_THRESHOLD", 0)
+    parallel = DocumentationGenerator(parsed_files).generate()
+    
+    assert parallel == serial, "Expected worker processes to render the same documentation"
+
+
+def test_only_python_suffix_is_rewritten_in_documentation_paths(parse_source):
+    """
+    Given files whose directory and file names contain ".py" before the suffix
+    When I generate documentation for them
+    Then only the .py suffix should be replaced by .md in output paths and index links
+    """
+    parsed_files = dict([
+        parse_source("pkg.pyutils/a.python.py", "VALUE = 1\n"),
+        parse_source("other/b.py", "VALUE = 2\n"),
+    ])
+    docs = DocumentationGenerator(parsed_files).generate()
+    
+    assert ("pkg.pyutils/a.python.md" in docs, "(a.python.md)" in docs["index.md"]) == (True, True), \
+        f"Expected only the .py suffix to be rewritten, but got {sorted(docs)}\n{docs['index.md']}"
+
+
+@pytest.mark.parametrize("source,expected", [
+    ('"""Constants only."""\n\nLIMIT = 10\n', False),
+    ('def ping():\n    """Reply."""\n', True),
+], ids=["without_functions_or_classes", "with_function"])
+def test_table_of_contents_only_for_files_with_functions_or_classes(source, expected, parse_source):
+    """
+    Given a parsed file with or without functions and classes
+    When I generate its documentation
+    Then a table of contents should be present only if there is something to list
+    """
+    file_path, file_info = parse_source("module.py", source)
+    docs = DocumentationGenerator({file_path: file_info}).generate()
+    
+    assert ("## Table of Contents" in docs["module.md"]) is expected, \
+        f"Expected a table of contents: {expected}\n{docs['module.md']}"
+
+
+@pytest.fixture
+def receiver_file(parse_source):
+    """
+    Fixture providing a parsed class whose methods take self/cls in unusual ways.
+    """
+    return parse_source("receivers.py", '''
+        class Factory:
+            """Builds things."""
+            
+            @classmethod
+            def create(cls):
+                """Build one."""
+                return cls()
+            
+            def adopt(self, cls):
+                """Adopt a class."""
+                return cls
+            
+            def join(self, sep="self, cls, "):
+                """Join with a separator."""
+                return sep
+            
+            def __new__(cls, value):
+                """Allocate one."""
+                return super().__new__(cls)
+        ''')
+
+
+@pytest.mark.parametrize("signature", [
+    "@classmethod\ndef create(cls)\n",
+    "def adopt(self, cls)\n",
+    "def join(self, sep='self, cls, ')\n",
+    "def __new__(cls, value)\n",
+], ids=["classmethod_without_parameters", "parameter_named_cls", "default_containing_receiver_names",
+        "implicit_classmethod"])
+def test_method_signature_keeps_only_its_own_receiver(signature, receiver_file):
+    """
+    Given a method whose parameters or defaults mention self or cls
+    When I generate documentation for its class
+    Then its signature should show the receiver once and its parameters unchanged
+    """
+    file_path, file_info = receiver_file
+    docs = DocumentationGenerator({file_path: file_info}).generate()
+    
+    assert f"```python\n{signature}```" in docs["receivers.md"], \
+        f"Expected the signature {signature!r}\n{docs['receivers.md']}"
+
+
+@pytest.fixture
+def attributes_file(parse_source):
+    """
+    Fixture providing parsed classes with and without an Attributes section.
+    
+    NumPy style is used because it keeps the Attributes section in the class description.
+    """
+    return parse_source("attributes.py", '''
+        class WithAttributes:
+            """Holds a greeting.
+            
+            Attributes:
+                greeting: Word to greet with
+            """
+        
+        
+        class MentionsAttributes:
+            """Has no Attributes section, only mentions Attributes."""
+        
+        
+        class Cache:
+            """Caches values.
+            
+            Attributes:
+                store: Note: shared between instances
+                size: Number of entries
+            
+            Note:
+                Not thread safe.
+            
+            Attributes:
+                hits: Number of cache hits
+            """
+        ''', docstring_style="numpy")
+
+
+@pytest.mark.parametrize("class_name,expected", [
+    ("WithAttributes", True),
+    ("MentionsAttributes", False),
+])
+def test_attributes_heading_only_for_attributes_section(class_name, expected, attributes_file):
+    """
+    Given a class whose description may or may not contain an Attributes: section
+    When I generate documentation for it
+    Then an Attributes heading should be present only for a class with the section
+    """
+    file_path, file_info = attributes_file
+    page = DocumentationGenerator({file_path: file_info}).generate()["attributes.md"]
+    section = page.split(f"## `{class_name}`", 1)[1].split("\n## `", 1)[0]
+    
+    assert ("**Attributes:**" in section) is expected, \
+        f"Expected an Attributes heading for {class_name}: {expected}\n{section}"
+
+
+def _attributes_block(page, class_name):
+    """
+    Get the lines under the Attributes heading of a class section.
+    """
+    section = page.split(f"## `{class_name}`", 1)[1].split("\n## `", 1)[0]
+    return section.split("**Attributes:**\n\n", 1)[1].split("\n\n", 1)[0].splitlines()
+
+
+@pytest.mark.parametrize("line,expected", [
+    ("    store: Note: shared between instances", True),
+    ("    hits: Number of cache hits", True),
+    ("    Not thread safe.", False),
+], ids=["mentions_section_name", "second_attributes_section", "other_section"])
+def test_attributes_sections_end_only_at_section_headers(line, expected, attributes_file):
+    """
+    Given a class with two Attributes sections separated by a Note section, one attribute mentioning Note:
+    When I generate documentation for it
+    Then every line of both Attributes sections, and no other line, should be listed under the heading
+    """
+    file_path, file_info = attributes_file
+    block = _attributes_block(DocumentationGenerator({file_path: file_info}).generate()["attributes.md"], "Cache")
+    
+    assert (line in block) is expected, f"Expected {line!r} under the Attributes heading: {expected}\n{block}"
@@ -5,308 +5,116 @@ Each test corresponds to one scenario in features/make_gherkins.feature.
 Test docstrings are taken directly from the Gherkin scenarios.
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 
-from utils import make_gherkins, GherkinGenerator
-from tests.conftest import FixtureError
+from utils import make_gherkins, make_gherkins_async, make_gherkins_batch, GherkinGenerator, GherkinMetadata
 
 
 
 # Fixtures
-@pytest.fixture
-def gherkin_generator(api_key, max_iterations, mock_openai_api):
-    """
-    Fixture to provide a GherkinGenerator instance with mocked OpenAI API.
-    """
-    try:
-        return GherkinGenerator(api_key=api_key, max_iterations=max_iterations)
-    except Exception as e:
-        raise FixtureError(f"Failed to create GherkinGenerator fixture: {e}")
-
-
-@pytest.fixture
-def simple_function():
-    """
-    Fixture providing a simple function with a docstring containing description, parameters, and returns.
-    """
-    def add_numbers(a: int, b: int) -> int:
-        """Add two numbers together.
-        
-        Args:
-            a: First number
-            b: Second number
-            
-        Returns:
-            int: Sum of a and b
-        """
-        return a + b
-    return add_numbers
-
-
-@pytest.fixture
-def function_with_multiple_parameters():
-    """
-    Fixture providing a callable with multiple documented parameters.
-    """
-    def process_data(name: str, age: int, email: str, active: bool) -> dict:
-        """Process user data with multiple parameters.
-        
-        Args:
-            name: User's full name
-            age: User's age in years
-            email: User's email address
-            active: Whether user account is active
-            
-        Returns:
-            dict: Processed user data
-        """
-        return {"name": name, "age": age, "email": email, "active": active}
-    return process_data
-
-
-@pytest.fixture
-def function_with_examples():
-    """
-    Fixture providing a callable with docstring examples.
-    """
-    def multiply(x: int, y: int) -> int:
-        """Multiply two numbers.
-        
-        Args:
-            x: First number
-            y: Second number
-            
-        Returns:
-            int: Product of x and y
-            
-        Examples:
-            multiply(2, 3)  # Returns 6
-            multiply(5, 4)  # Returns 20
-            multiply(0, 10) # Returns 0
-        """
-        return x * y
-    return multiply
-
-
-@pytest.fixture
-def class_method_with_docstring():
-    """
-    Fixture providing a class method with a comprehensive docstring.
-    """
-    class Calculator:
-        """A simple calculator class."""
-        
-        def __init__(self, precision: int = 2):
-            """Initialize calculator.
-            
-            Args:
-                precision: Decimal places for rounding
-            """
-            self.precision = precision
-        
-        def divide(self, a: float, b: float) -> float:
-            """Divide two numbers with precision.
-            
-            Args:
-                a: Numerator
-                b: Denominator
-                
-            Returns:
-                float: Result of division rounded to precision
-                
-            Raises:
-                ZeroDivisionError: If b is zero
-            """
-            return round(a / b, self.precision)
-    
-    return Calculator().divide
-
-
-@pytest.fixture
-def callable_without_docstring():
-    """
-    Fixture providing a callable without a docstring.
-    """
-    def no_docs(x):
-        return x * 2
-    return no_docs
-
-
-@pytest.fixture
-def callable_with_complete_docstring():
-    """
-    Fixture providing a callable with a complete docstring.
-    """
-    def complete_function(data: list, threshold: int = 10) -> dict:
-        """Process a list of data with comprehensive documentation.
-        
-        This function filters and processes data based on a threshold value.
-        It returns a dictionary with statistics and filtered results.
-        
-        Args:
-            data: List of integer values to process
-            threshold: Minimum value to include (default: 10)
-            
-        Returns:
-            dict: Dictionary containing:
-                - count: Number of items above threshold
-                - sum: Sum of filtered items
-                - items: List of filtered items
-                
-        Raises:
-            TypeError: If data is not a list
-            ValueError: If threshold is negative
-            
-        Examples:
-            complete_function([5, 15, 20], 10)  # Returns {'count': 2, 'sum': 35, 'items': [15, 20]}
-            complete_function([1, 2, 3], 0)     # Returns {'count': 3, 'sum': 6, 'items': [1, 2, 3]}
-        """
-        if not isinstance(data, list):
-            raise TypeError("data must be a list")
-        if threshold < 0:
-            raise ValueError("threshold must be non-negative")
-        
-        filtered = [x for x in data if x >= threshold]
-        return {
-            "count": len(filtered),
-            "sum": sum(filtered),
-            "items": filtered
-        }
-    return complete_function
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def function_dict(
     simple_function,
     function_with_multiple_parameters,
     function_with_examples,
-    class_method_with
+    class_method_with_docstring,
+    callable_without_docstring,
+    callable_with_complete_docstring
 ):
+    """
+    Fixture mapping fixture names to the sample callables, for tests parametrized by fixture name.
+    """
     return {
         "simple_function": simple_function,
         "function_with_multiple_parameters": function_with_multiple_parameters,
         "function_with_examples": function_with_examples,
-        "class_method_with_docstring": class_method_with
-    } 
-
-
-@pytest.fixture
-def mock_gherkin_content():
-    """
-    Fixture providing sample Gherkin content for validation tests.
-    """
-    return """Feature: Sample Feature
-  As a user
-  I want to use the function
-  So that I can get results
-
-  Background:
-    Given the callable 'sample' with signature (x: int) -> int
-    And the callable is accessible through the public API
-
-  Scenario: Main execution
-    Given an integer input
-    When I call sample with the input
-    Then it should return an integer result"""
-
-
-@pytest.fixture
-def mock_metadata():
-    """
-    Fixture providing sample metadata for validation tests.
-    """
-    return {
-        "feature_name": "Sample Feature",
-        "feature_file_path": "features/sample.feature",
-        "creation_timestamp": "2025-11-19T03:00:00",
-        "callable_name": "sample",
-        "callable_signature": "(x: int) -> int",
-        "num_scenarios": 2,
-        "content_hash": "abc123def456",
-        "has_examples": False,
-        "has_parameters": True,
-        "has_return": True,
-        "content_length": 250,
-        "description": "Sample function description",
-        "llm_iterations": 3
+        "class_method_with_docstring": class_method_with_docstring,
+        "callable_without_docstring": callable_without_docstring,
+        "callable_with_complete_docstring": callable_with_complete_docstring
     }
 
 
-
-def test_generate_gherkin_from_simple_function_docstring__metadata_dictionary_returned(
-    simple_function, api_key, mock_openai_api
-):
+@pytest.fixture(scope="session")
+def all_generated(function_dict, gherkin_results):
     """
-    Given a callable with a docstring containing description, parameters, and returns
-    When I call make_gherkins with the callable's docstring
-    Then a metadata dictionary should be returned
-    """
-    content, metadata = make_gherkins(simple_function, api_key=api_key)
+    Fixture generating Gherkin for every sample callable concurrently, keyed by fixture name.
     
-    assert isinstance(metadata, dict), "make_gherkins should return a metadata dictionary"
-
+    The generations are independent, so a thread pool overlaps their LLM round trips.
+    """
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return dict(zip(function_dict, executor.map(gherkin_results, function_dict.values())))
 
 
-def test_generate_gherkin_from_simple_function_docstring__gherkin_file_generated(
-    simple_function, api_key, mock_openai_api
+@pytest.mark.parametrize("check,message", [
+    (lambda content, metadata: isinstance(metadata, GherkinMetadata), "make_gherkins should return a GherkinMetadata"),
+    (lambda content, metadata: len(content) > 0, "Generated Gherkin content should not be empty"),
+], ids=["metadata_dictionary_returned", "gherkin_file_generated"])
+def test_generate_gherkin_from_simple_function_docstring(
+    check, message, simple_function, gherkin_results
 ):
     """
     Given a callable with a docstring containing description, parameters, and returns
     When I call make_gherkins with the callable's docstring
-    Then a Gherkin feature file should be generated
+    Then the checked part of the result (metadata dictionary or Gherkin content) should be produced
     """
-    content, metadata = make_gherkins(simple_function, api_key=api_key)
+    content, metadata = gherkin_results(simple_function)
     
-    assert len(content) > 0, "Generated Gherkin content should not be empty"
+    assert check(content, metadata), message
 
 
 def test_handle_callable_without_docstring__minimal_gherkin_generated(
-    callable_without_docstring, api_key, mock_openai_api
+    callable_without_docstring, gherkin_results
 ):
     """
     Given a callable without a docstring
     When I call make_gherkins with the callable
     Then a minimal Gherkin feature file should be generated
     """
-    content, metadata = make_gherkins(callable_without_docstring, api_key=api_key)
+    content, metadata = gherkin_results(callable_without_docstring)
     
     assert len(content) > 0, "Even without docstring, a minimal Gherkin file should be generated"
 
 
-@pytest.mark.parametrize("fixture_name", [
+@pytest.fixture(scope="class")
+def generated(request, all_generated):
+    """
+    Fixture providing the Gherkin generated for one callable, shared by every test in a class.
+    
+    Parametrize it indirectly with the fixture name of the callable to generate from.
+    """
+    return all_generated[request.param]
+
+
+@pytest.mark.parametrize("generated", [
     "class_method_with_docstring",
     "function_with_examples",
     "function_with_multiple_parameters",
     "simple_function",
-])
+], indirect=True, scope="class")
 class TestGherkinContentSections:
-
-    @pytest.mark.parametrize("fixture_name,expected_content", [
-        "Background:",
+    
+    @pytest.mark.parametrize("expected_content", [
         "Feature:",
+        "Background:",
         "Scenario:",
-        "Examples:",
-        "Scenario:",
-        "API",
         "Given",
-        "Scenario:",
         "When",
         "Then",
-        "Background:",
-        "Feature:",
-        "Scenario:",
+        "API",
     ])
     def test_generate_gherkin_contains_expected_content(
-        fixture_name, expected_content, request, api_key, mock_openai_api
+        self, expected_content, generated
     ):
         """
         Given a callable with a docstring
         When I call make_gherkins with the callable's docstring
         Then the generated content should contain the expected sections
         """
-        callable_fixture = request.getfixturevalue(fixture_name)
-        content, metadata = make_gherkins(callable_fixture, api_key=api_key)
+        content, metadata = generated
         
         assert expected_content in content, \
             f"Gherkin did not contain the expected '{expected_content}' section\n{content}"
@@ -319,15 +127,14 @@ class TestGherkinContentSections:
         'callable_signature',
     ])
     def test_generate_gherkin_from_simple_function_docstring__metadata_contains_fields(
-        expected_field, fixture_name, expected_content, request, api_key, mock_openai_api
+        self, expected_field, generated
     ):
         """
         Given a callable with a docstring containing description, parameters, and returns
         When I call make_gherkins with the callable's docstring
         Then the metadata dictionary should contain required fields
         """
-        callable_fixture = request.getfixturevalue(fixture_name)
-        content, metadata = make_gherkins(callable_fixture, api_key=api_key)
+        content, metadata = generated
 
         assert expected_field in metadata, \
             f"Expected metatadata to contain field '{expected_field}', but it didn't\n{metadata}"
@@ -341,14 +148,14 @@ class TestGherkinContentSections:
     "content_hash",
 ])
 def test_return_comprehensive_metadata_dictionary_contains_required_fields(
-    field, callable_with_complete_docstring, api_key, mock_openai_api
+    field, callable_with_complete_docstring, gherkin_results
 ):
     """
     Given a callable with a complete docstring
     When I call make_gherkins with the callable's docstring
     Then the dictionary should contain the required metadata fields
     """
-    content, metadata = make_gherkins(callable_with_complete_docstring, api_key=api_key)
+    content, metadata = gherkin_results(callable_with_complete_docstring)
 
     assert field in metadata, f"Metadata must containt '{field}' field, but it didn't"
 
@@ -361,15 +168,98 @@ def test_return_comprehensive_metadata_dictionary_contains_required_fields(
     ("callable_without_docstring", "has_return", False),
 ])
 def test_metadata_boolean_fields(
-    fixture_name, field, expected_value, request, api_key
+    fixture_name, field, expected_value, all_generated
 ):
     """
     Given an arbitrary callable
     When I call make_gherkins with that callable
     Then the metadata dictionary should reflect the presence of parameters, return values, and examples in the callable.
     """
-    callable_fixture = request.getfixturevalue(fixture_name)
-    _, metadata = make_gherkins(callable_fixture, api_key=api_key)
+    _, metadata = all_generated[fixture_name]
 
     assert metadata[field] is expected_value, f"Expected metadata field '{field}' to be '{expected_value}', but got '{metadata[field]}'"
 
+
+def test_cached_generation_is_reused(simple_function, api_key, tmp_path):
+    """
+    Given a Gherkin generation stored in the on-disk cache
+    When I call make_gherkins again with the same callable and caching enabled
+    Then the cached content and metadata should be returned
+    """
+    first = make_gherkins(simple_function, api_key=api_key, use_cache=True, cache_dir=str(tmp_path))
+    second = make_gherkins(simple_function, api_key=api_key, use_cache=True, cache_dir=str(tmp_path))
+
+    assert second == first, "Expected the second generation to be served from the cache"
+
+
+@pytest.mark.parametrize("model_attribute", ["GENERATION_MODEL", "REVIEW_MODEL"])
+def test_model_change_invalidates_cached_generation(model_attribute, simple_function, api_key, tmp_path, monkeypatch):
+    """
+    Given a Gherkin generation stored in the on-disk cache
+    When I call make_gherkins again with caching enabled after a model is changed
+    Then the Gherkin should be generated again instead of served from the cache
+    """
+    make_gherkins(simple_function, api_key=api_key, use_cache=True, cache_dir=str(tmp_path))
+    monkeypatch.setattr(GherkinGenerator, model_attribute, "another-model")
+    headers = []
+    generate_header = GherkinGenerator._generate_feature_header_with_llm
+    
+    def counting_generate_header(self, *args, **kwargs):
+        headers.append(args)
+        return generate_header(self, *args, **kwargs)
+    
+    monkeypatch.setattr(GherkinGenerator, "_generate_feature_header_with_llm", counting_generate_header)
+    make_gherkins(simple_function, api_key=api_key, use_cache=True, cache_dir=str(tmp_path))
+    
+    assert headers, f"Expected a change of {model_attribute} to invalidate the cached generation"
+
+
+def test_batch_generation_preserves_input_order(function_dict, api_key):
+    """
+    Given several callables with docstrings
+    When I call make_gherkins_batch with the callables
+    Then one result per callable should be returned in input order
+    """
+    callables = [function_dict["simple_function"], function_dict["function_with_examples"]]
+    results = make_gherkins_batch(callables, api_key=api_key)
+
+    assert [metadata["callable_name"] for _, metadata in results] == ["add_numbers", "multiply"], \
+        f"Expected batch results in input order, but got {results}"
+
+
+def test_async_generation_preserves_input_order(function_dict, api_key):
+    """
+    Given several callables with docstrings
+    When I await make_gherkins_async with the callables
+    Then one result per callable should be returned in input order
+    """
+    callables = [function_dict["simple_function"], function_dict["function_with_examples"]]
+    results = asyncio.run(make_gherkins_async(callables, api_key=api_key, concurrency=2))
+    
+    assert [metadata["callable_name"] for _, metadata in results] == ["add_numbers", "multiply"], \
+        f"Expected async results in input order, but got {results}"
+
+
+def test_recorded_generation_is_replayed(simple_function, api_key, tmp_path, monkeypatch):
+    """
+    Given a Gherkin generation recorded in a replay fixtures directory
+    When I call make_gherkins again with recording disabled
+    Then the recorded content and metadata should be replayed
+    """
+    recorded = make_gherkins(simple_function, api_key=api_key, replay_fixtures_dir=str(tmp_path))
+    monkeypatch.setenv("GHERKIN_RECORD", "0")
+    replayed = make_gherkins(simple_function, api_key=api_key, replay_fixtures_dir=str(tmp_path))
+
+    assert replayed == recorded, "Expected the second generation to be replayed from the recording"
+
+
+def test_missing_recording_fails_when_recording_disabled(simple_function, api_key, tmp_path, monkeypatch):
+    """
+    Given an empty replay fixtures directory
+    When I call make_gherkins with recording disabled
+    Then a FileNotFoundError should be raised instead of generating
+    """
+    monkeypatch.setenv("GHERKIN_RECORD", "0")
+
+    with pytest.raises(FileNotFoundError):
+        make_gherkins(simple_function, api_key=api_key, replay_fixtures_dir=str(tmp_path))
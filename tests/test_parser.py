@@ -0,0 +1,83 @@
+"""
+Tests for CodeParser.
+"""
+
+import textwrap
+
+import pytest
+
+
+from utils.parser import CodeParser
+
+
+
+# Fixtures
+@pytest.fixture
+def hierarchy_files(tmp_path):
+    """
+    Fixture writing two files, the second defining a class that inherits from one in the first.
+    
+    Returns the paths of the files in the order they should be parsed.
+    """
+    sources = {
+        "base.py": '''
+            class Base:
+                """Base class."""
+                
+                def greet(self, name: str) -> str:
+                    """Greet someone.
+                    
+                    Args:
+                        name: Who to greet
+                    """
+                    return name
+            ''',
+        "child.py": '''
+            from base import Base
+            
+            
+            class Child(Base):
+                """Child class."""
+                
+                def wave(self):
+                    """Wave."""
+            ''',
+    }
+    paths = []
+    for name, source in sources.items():
+        path = tmp_path / name
+        path.write_text(textwrap.dedent(source))
+        paths.append(str(path))
+    return paths
+
+
+def test_added_files_resolve_inheritance_like_sequential_parsing(hierarchy_files):
+    """
+    Given files parsed independently without resolving inheritance
+    When I add them in order to another parser with add_parsed_file
+    Then the results should match parsing the files one after another with that parser
+    """
+    sequential_parser = CodeParser()
+    expected = [sequential_parser.parse(path) for path in hierarchy_files]
+    
+    combining_parser = CodeParser()
+    results = [CodeParser().parse(path, resolve_inheritance=False) for path in hierarchy_files]
+    for result in results:
+        combining_parser.add_parsed_file(result)
+    
+    assert results == expected, "Expected added files to resolve inheritance as if parsed sequentially"
+
+
+def test_added_file_registers_inherited_methods(hierarchy_files):
+    """
+    Given a base class file and a subclass file parsed independently
+    When I add them in order to another parser with add_parsed_file
+    Then the subclass should list the methods it inherits from the base class
+    """
+    parser = CodeParser()
+    for path in hierarchy_files:
+        parser.add_parsed_file(CodeParser().parse(path, resolve_inheritance=False))
+    child = parser.parsed_classes["Child"]
+    
+    assert [method["name"] for method in child["inherited_methods"].get("Base", [])] == ["greet"], \
+        f"Expected Child to inherit greet from Base, but got {child.get('inherited_methods')}"
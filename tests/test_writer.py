@@ -0,0 +1,112 @@
+"""
+Tests for OutputWriter.
+"""
+
+import os
+
+import pytest
+
+
+from utils.writer import OutputWriter
+
+
+
+# Fixtures
+@pytest.fixture
+def output_dir(tmp_path):
+    """
+    Fixture providing an empty output directory.
+    """
+    return tmp_path / "out"
+
+
+def _read_tree(root):
+    """
+    Read every file below a directory, keyed by its path relative to the directory.
+    """
+    return {
+        os.path.relpath(os.path.join(directory, name), root): open(os.path.join(directory, name), encoding="utf-8").read()
+        for directory, _, names in os.walk(root)
+        for name in names
+    }
+
+
+@pytest.mark.parametrize("as_iterator", [False, True], ids=["mapping", "iterator"])
+def test_pages_are_written_to_output_directory(as_iterator, output_dir):
+    """
+    Given pages as a mapping or as an iterator of (path, content) pairs
+    When I write them with OutputWriter
+    Then each page should be written below the output directory with its content
+    """
+    pages = {
+        "index.md": "# Index",
+        "pkg/module.md": "# Module é",
+        "pkg/sub/large.md": "x" * (OutputWriter.SMALL_FILE_LIMIT + 1),
+    }
+    OutputWriter(str(output_dir)).write(iter(pages.items()) if as_iterator else pages)
+    
+    assert _read_tree(output_dir) == {os.path.normpath(path): content for path, content in pages.items()}, \
+        "Expected every page to be written with its content"
+
+
+def test_pages_before_a_failing_page_are_written(output_dir):
+    """
+    Given an iterator of pages that fails partway through
+    When I write it with OutputWriter
+    Then the error should propagate and the pages pulled before it should be written
+    """
+    def pages():
+        for i in range(OutputWriter.MAX_PENDING_WRITES * 2):
+            yield f"page_{i}.md", f"page {i}"
+        raise RuntimeError("rendering failed")
+    
+    with pytest.raises(RuntimeError, match="rendering failed"):
+        OutputWriter(str(output_dir)).write(pages())
+    
+    assert len(_read_tree(output_dir)) == OutputWriter.MAX_PENDING_WRITES * 2, \
+        "Expected the pages pulled before the failure to be written"
+
+
+def test_unchanged_page_is_not_rewritten(output_dir):
+    """
+    Given a page already written with the same content
+    When I write it again with OutputWriter
+    Then the existing file should be left untouched
+    """
+    OutputWriter(str(output_dir)).write({"page.md": "same"})
+    page = output_dir / "page.md"
+    os.utime(page, ns=(0, 0))
+    OutputWriter(str(output_dir)).write({"page.md": "same"})
+    
+    assert page.stat().st_mtime_ns == 0, "Expected an unchanged page not to be rewritten"
+
+
+def test_pages_are_written_while_input_is_still_being_produced(output_dir):
+    """
+    Given an iterator producing more pages than the writer keeps pending
+    When I write it with OutputWriter
+    Then pages should already be on disk before the iterator produces its last page
+    """
+    written_before_last = []
+    
+    def pages():
+        for i in range(OutputWriter.MAX_PENDING_WRITES * 2):
+            yield f"page_{i}.md", f"page {i}"
+        written_before_last.append(len(_read_tree(output_dir)))
+        yield "last.md", "last"
+    
+    OutputWriter(str(output_dir)).write(pages())
+    
+    assert written_before_last[0] > 0, "Expected pages to be written as they are produced"
+
+
+def test_last_page_for_the_same_path_wins(output_dir):
+    """
+    Given several pages for the same output path, such as a module index.md and the generated index
+    When I write them with OutputWriter
+    Then the file should hold the content of the last page
+    """
+    pages = [("index.md", str(i) * OutputWriter.SMALL_FILE_LIMIT) for i in range(10)]
+    OutputWriter(str(output_dir)).write(pages)
+    
+    assert _read_tree(output_dir) == {"index.md": pages[-1][1]}, "Expected the last page for a path to be written"
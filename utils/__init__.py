@@ -4,7 +4,9 @@ Documentation Generator Package.
 This package provides tools for parsing Python code and generating documentation.
 """
 
-from .gherkin_generator import make_gherkins, GherkinGenerator
+from .gherkin_generator import (
+    make_gherkins, make_gherkins_async, make_gherkins_batch, GherkinGenerator, GherkinMetadata
+)
 
 __version__ = "0.1.0"
-__all__ = ['make_gherkins', 'GherkinGenerator']
\ No newline at end of file
+__all__ = ['make_gherkins', 'make_gherkins_async', 'make_gherkins_batch', 'GherkinGenerator', 'GherkinMetadata']
\ No newline at end of file
@@ -3,8 +3,12 @@ Command-line interface for the documentation generator.
 """
 
 import argparse
+import fnmatch
+import functools
 import os
-from typing import List
+from pathlib import Path
+import re
+from typing import Callable, Iterable, Iterator, List
 
 
 from .logger import logger
@@ -23,8 +27,24 @@ def load_ignore_paths(file_path: str) -> List[str]:
     if not os.path.exists(file_path):
         return []
         
-    with open(file_path, 'r') as f:
-        return [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+    # Split the whole file at once in C rather than iterating over a buffered file object
+    return list(_iter_ignore_lines(Path(file_path).read_text().splitlines()))
+
+
+def _iter_ignore_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the non-blank, non-comment lines of an ignore file, stripping each once.
+    
+    Args:
+        lines: Lines of the ignore file
+    
+    Returns:
+        Iterator[str]: Stripped ignore paths
+    """
+    for line in lines:
+        stripped = line.strip()
+        if stripped and stripped[0] != '#':
+            yield stripped
 
 
 def save_ignore_paths(file_path: str, paths: List[str]) -> None:
@@ -35,19 +55,85 @@ def save_ignore_paths(file_path: str, paths: List[str]) -> None:
         file_path: Path to the file to save ignore paths
         paths: List of paths to ignore
     """
-    with open(file_path, 'w') as f:
-        f.write("# Paths to ignore when generating documentation\n")
-        for path in paths:
-            f.write(f"{path}\n")
+    content = "# Paths to ignore when generating documentation\n" + "".join(f"{path}\n" for path in paths)
+    with open(file_path, 'w', buffering=64 * 1024) as f:
+        f.write(content)
 
 
-def parse_args() -> argparse.Namespace:
+def compile_ignore_matcher(paths: List[str]) -> Callable[[str], bool]:
     """
-    Parse command-line arguments.
+    Build a predicate matching paths against ignore paths in a single regex call.
+    
+    Each ignore path may be a plain path or a glob, and matches the path itself
+    and everything below it. Ignore paths are made absolute here, once, so the
+    returned predicate expects absolute, normalized paths, as FileProcessor
+    passes them, and does no path manipulation of its own.
+    
+    Args:
+        paths: List of paths or glob patterns to ignore
+    
+    Returns:
+        Callable[[str], bool]: Function returning True if an absolute path should be ignored
+    """
+    patterns = set()
+    for path in paths:
+        abs_path = os.path.abspath(path)
+        patterns.add(fnmatch.translate(abs_path))
+        patterns.add(fnmatch.translate(os.path.join(abs_path, '*')))
+    
+    pattern = '|'.join(sorted(patterns))
+    if not pattern:
+        is_ignored = lambda path: False
+    else:
+        match = re.compile(pattern).match
+        
+        def is_ignored(path: str) -> bool:
+            return match(path) is not None
+    
+    # Matchers with equal patterns ignore the same paths, so caches such as
+    # FileProcessor's scan cache can key on the pattern instead of the function
+    is_ignored.pattern = pattern
+    return is_ignored
 
+
+def existing_path(path: str) -> str:
+    """
+    Argument type accepting only paths that exist.
+    
+    Args:
+        path: Path given on the command line
+    
     Returns:
-        argparse.Namespace: Parsed command-line arguments
+        str: The path, unchanged
+    
+    Raises:
+        argparse.ArgumentTypeError: If the path does not exist
+    """
+    if not os.path.exists(path):
+        raise argparse.ArgumentTypeError(f"Input path does not exist: {path}")
+    return path
 
+
+def docs_subdir(path: str) -> str:
+    """
+    Argument type placing output in a 'docs' subdirectory of the given path.
+    
+    Args:
+        path: Output path given on the command line
+    
+    Returns:
+        str: The 'docs' subdirectory of the path
+    """
+    return os.path.join(path, "docs")
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line argument parser, once per process.
+
+    Returns:
+        argparse.ArgumentParser: Parser for the documentation generator's arguments
     """
     parser = argparse.ArgumentParser(
         prog="documentation_generator",
@@ -57,12 +143,14 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--input",
         required=True,
+        type=existing_path,
         help="Path to Python file or directory to generate documentation from (type: str)."
     )
 
     parser.add_argument(
         "--output",
         default="./docs",
+        type=docs_subdir,
         help="Path to output directory for documentation (default: ./docs) (type: str)."
     )
 
@@ -105,6 +193,12 @@ def parse_args() -> argparse.Namespace:
         help="Save ignore paths to ignore file (Default: True) (type: bool)."
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory to cache rendered pages in, so unchanged files are not re-rendered on later runs (default: None) (type: str)."
+    )
+
     parser.add_argument(
         "--inheritance",
         action="store_true",
@@ -117,14 +211,18 @@ def parse_args() -> argparse.Namespace:
         help="Enable self-documentation mode for documenting this tool itself (Default: False) (type: bool)."
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command-line arguments.
 
-    # Validate input path
-    if not os.path.exists(args.input):
-        parser.error(f"Input path does not exist: {args.input}")
+    Returns:
+        argparse.Namespace: Parsed command-line arguments
 
-    # Always put output in a 'docs' subdirectory of the specified output path
-    args.output = os.path.join(args.output, "docs")
+    """
+    args = _build_parser().parse_args()
 
     # Load ignore paths from file if it exists
     file_ignore_paths = load_ignore_paths(args.ignore_file)
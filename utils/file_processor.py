@@ -2,30 +2,128 @@
 File processing module for the documentation generator.
 """
 
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import os
-from typing import List
+import stat
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 import os.path
 
 
 from .logger import logger
 
 
+# Results of recent directory scans, keyed by the scan's inputs. Each entry holds
+# the scan time, the mtime of every directory listed, and the files found.
+_SCAN_CACHE: "OrderedDict[Tuple, Tuple[int, Dict[str, int], List[str]]]" = OrderedDict()
+_SCAN_CACHE_SIZE: int = 32
+# FileProcessors may scan from several threads at once, and OrderedDict updates are not atomic
+_SCAN_CACHE_LOCK = threading.Lock()
+# Directories modified this close to a scan may change again within the same mtime tick
+_RACY_WINDOW_NS: int = 2_000_000_000
+# Where supported, directories are opened once and listed through the file descriptor
+_SCANDIR_FD: bool = os.scandir in os.supports_fd and hasattr(os, 'O_DIRECTORY')
+
+
 class FileProcessor:
     """
     Process files and directories to find Python files for documentation.
     """
     IGNORED_DIRS: list[str] = ['venv', '.venv', 'env', '.env', '.git', 'deprecated', 'docs']
+    # Directories listed in this thread before the rest of the scan moves to a thread
+    # pool; starting the pool costs more than listing a small tree directly
+    PARALLEL_DIR_THRESHOLD: int = 64
     
-    def __init__(self, input_path: str, ignore_paths: List[str] = None):
+    def __init__(
+        self,
+        input_path: str,
+        ignore_paths: List[str] = None,
+        parallel: bool = True,
+        is_ignored: Optional[Callable[[str], bool]] = None,
+        max_workers: Optional[int] = None
+    ):
         """
         Initialize the file processor.
         
         Args:
             input_path: Path to input file or directory
             ignore_paths: List of paths to ignore when finding Python files
+            parallel: Whether to scan directories from a thread pool once more
+                than PARALLEL_DIR_THRESHOLD directories have been listed
+            is_ignored: Precompiled ignore predicate taking an absolute, normalized
+                path, such as one built by cli.compile_ignore_matcher(). It is
+                consulted for paths that ignore_paths does not already exclude
+            max_workers: Number of threads listing directories in parallel
+                (default: four per CPU, at most 32)
         """
         self.input_path = input_path
         self.ignore_paths = ignore_paths or []
+        self.parallel = parallel
+        self.is_ignored = is_ignored
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        # os.path.abspath calls getcwd() for every relative path, so look it up once
+        self._cwd = os.getcwd()
+    
+        # Normalize ignore paths once, rather than for every path checked
+        abs_ignores = {self._fast_abspath(path) for path in self.ignore_paths}
+        self._ignore_key = tuple(sorted(abs_ignores))
+        self._abs_ignores = frozenset(abs_ignores)
+        self._abs_ignore_prefixes = tuple(path + os.sep for path in self._abs_ignores)
+        # Entries found while scanning can only match ignore paths related to the input path
+        self._scan_ignores = self._minimize_ignores(abs_ignores, self._fast_abspath(input_path))
+    
+        # Identify ignored directories by device and inode too, so they are also
+        # recognized when reached through another path, such as a symlink or bind
+        # mount. This uses every ignore path: one outside the input tree by name
+        # may still lead into it.
+        self._ignored_dir_ids = set()
+        for path in abs_ignores:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if stat.S_ISDIR(st.st_mode):
+                self._ignored_dir_ids.add((st.st_dev, st.st_ino))
+        self._ignored_inodes = frozenset(ino for _, ino in self._ignored_dir_ids)
+        self._has_ignores = bool(self._scan_ignores) or is_ignored is not None
+    
+    @staticmethod
+    def _minimize_ignores(abs_ignores: Set[str], abs_input: str) -> FrozenSet[str]:
+        """
+        Drop ignore paths that cannot affect a scan of the input path.
+        
+        Ignore paths neither above nor below the input path never match a scanned
+        path by name, and ignore paths below another ignore path are already covered
+        by it. The result is only used for matching by name.
+        
+        Args:
+            abs_ignores: Absolute ignore paths
+            abs_input: Absolute input path
+        
+        Returns:
+            FrozenSet[str]: The ignore paths that can match
+        """
+        input_prefix = abs_input if abs_input.endswith(os.sep) else abs_input + os.sep
+        kept: List[str] = []
+        for path in sorted(abs_ignores, key=len):
+            related = path == abs_input or abs_input.startswith(path + os.sep) or path.startswith(input_prefix)
+            if related and not any(path.startswith(other + os.sep) for other in kept):
+                kept.append(path)
+        return frozenset(kept)
+    
+    def _fast_abspath(self, path: str) -> str:
+        """
+        Get the absolute path of a path, relative to the working directory at construction.
+        
+        Args:
+            path: Path to normalize
+        
+        Returns:
+            str: Normalized absolute path, as os.path.abspath would return it
+        """
+        return os.path.normpath(os.path.join(self._cwd, path))
     
     def should_ignore(self, path: str) -> bool:
         """
@@ -38,7 +136,7 @@ class FileProcessor:
             bool: True if the path should be ignored, False otherwise
         """
         # Normalize paths to absolute paths for comparison
-        abs_path = os.path.abspath(path)
+        abs_path = self._fast_abspath(path)
         logger.debug(f"Checking if path should be ignored: {abs_path}")
 
         # ALWAYS ignore virtual environment, deprecated, and git directories
@@ -46,17 +144,83 @@ class FileProcessor:
             if dir_name in abs_path:
                 logger.debug(f"Ignoring directory: {abs_path}")
                 return True
-
-        for ignore_path in self.ignore_paths:
-            # Normalize ignore path to absolute path
-            abs_ignore_path = os.path.abspath(ignore_path)
-
-            # Check if the path is the ignore path or is a subdirectory of the ignore path
-            if abs_path == abs_ignore_path or abs_path.startswith(abs_ignore_path + os.sep):
+        
+        # Check if the path is an ignore path or is a subdirectory of one
+        if abs_path in self._abs_ignores or abs_path.startswith(self._abs_ignore_prefixes):
+            return True
+        
+        return self.is_ignored is not None and self.is_ignored(abs_path)
+    
+    def _should_ignore_entry(self, name: str, abs_path: str) -> bool:
+        """
+        Check if an entry of a directory that is not itself ignored should be ignored.
+        
+        Equivalent to should_ignore(abs_path) given that the parent passed
+        should_ignore: none of IGNORED_DIRS contains a separator, so a match must
+        lie within the entry's name, and the entry can only fall under an ignore
+        path by being one.
+        
+        Args:
+            name: Name of the entry
+            abs_path: Absolute path of the entry
+        
+        Returns:
+            bool: True if the entry should be ignored, False otherwise
+        """
+        if self._matches_ignored_dirs(name) or abs_path in self._scan_ignores:
+            return True
+        
+        return self.is_ignored is not None and self.is_ignored(abs_path)
+    
+    def _matches_ignored_dirs(self, name: str) -> bool:
+        """
+        Check if an entry name contains one of IGNORED_DIRS.
+        
+        Args:
+            name: Name of the entry
+        
+        Returns:
+            bool: True if the entry should be ignored, False otherwise
+        """
+        for dir_name in self.IGNORED_DIRS:
+            if dir_name in name:
+                logger.debug(f"Ignoring directory: {name}")
                 return True
-                
         return False
     
+    def _is_ignored_dir(self, entry: os.DirEntry) -> bool:
+        """
+        Check if a directory entry is one of the ignored directories, by identity.
+        
+        The inode is usually known from the directory listing, so a stat call is
+        only made for entries whose inode matches an ignored directory's.
+        
+        Args:
+            entry: Directory entry to check
+        
+        Returns:
+            bool: True if the entry is an ignored directory, False otherwise
+        """
+        try:
+            if entry.inode() not in self._ignored_inodes:
+                return False
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            return False
+        return (st.st_dev, st.st_ino) in self._ignored_dir_ids
+    
+    def _cleared_abspath(self, directory: str) -> Optional[str]:
+        """
+        Get the absolute path of a directory if it is not ignored.
+        
+        Args:
+            directory: Directory to check
+        
+        Returns:
+            Optional[str]: Absolute path of the directory, or None if it is ignored
+        """
+        return None if self.should_ignore(directory) else self._fast_abspath(directory)
+    
     def find_python_files(self) -> List[str]:
         """
         Find all Python files in the input path, excluding ignored paths.
@@ -64,22 +228,229 @@ class FileProcessor:
         Returns:
             List[str]: List of paths to Python files
         """
-        python_files = []
+        return list(self.iter_python_files())
+        
+    def iter_python_files(self) -> Iterator[str]:
+        """
+        Iterate over the Python files in the input path, excluding ignored paths.
+        
+        Paths are yielded as the directories containing them are listed, in the
+        same order as find_python_files() returns them, so consumers can start
+        before the whole tree has been scanned.
         
+        Returns:
+            Iterator[str]: Paths to Python files
+        """
         if os.path.isfile(self.input_path):
             if self.input_path.endswith('.py') and not self.should_ignore(self.input_path):
-                python_files.append(self.input_path)
-        else:
-            # Walk the directory structure
-            for root, dirs, files in os.walk(self.input_path):
-                logger.debug(f"Processing directory: {root}")
+                yield self.input_path
+            return
+        
+        # A directory's mtime changes whenever an entry is added, removed or renamed in it,
+        # so if no listed directory changed, the previous result still holds. The key only
+        # holds values that decide the result: a matcher from cli.compile_ignore_matcher()
+        # is identified by its pattern, since callers build a new one for every run.
+        cache_key = (
+            self.input_path,
+            self._cwd,
+            self._ignore_key,
+            getattr(self.is_ignored, "pattern", self.is_ignored),
+            tuple(self.IGNORED_DIRS),
+        )
+        with _SCAN_CACHE_LOCK:
+            cached = _SCAN_CACHE.get(cache_key)
+        # Checked outside the lock, since it stats every listed directory
+        if cached is not None and self._scan_is_current(*cached[:2]):
+            with _SCAN_CACHE_LOCK:
+                if cache_key in _SCAN_CACHE:
+                    _SCAN_CACHE.move_to_end(cache_key)
+            yield from list(cached[2])
+            return
+        
+        scan_time = time.time_ns()
+        dir_mtimes: Dict[str, int] = {}
+        python_files = []
+        scan = self._scan_parallel if self.parallel else self._scan
+        for file_path in scan(self.input_path, dir_mtimes):
+            python_files.append(file_path)
+            yield file_path
+        
+        # Only complete scans are cached
+        with _SCAN_CACHE_LOCK:
+            _SCAN_CACHE[cache_key] = (scan_time, dir_mtimes, python_files)
+            _SCAN_CACHE.move_to_end(cache_key)
+            if len(_SCAN_CACHE) > _SCAN_CACHE_SIZE:
+                _SCAN_CACHE.popitem(last=False)
 
-                # Skip ignored directories
-                dirs[:] = [d for d in dirs if not self.should_ignore(os.path.join(root, d))]
-                
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if file.endswith('.py') and not self.should_ignore(file_path):
-                        python_files.append(file_path)
-        
-        return python_files
+    @staticmethod
+    def _scan_is_current(scan_time: int, dir_mtimes: Dict[str, int]) -> bool:
+        """
+        Check whether a previous scan is still valid.
+        
+        Args:
+            scan_time: Time the scan started, in nanoseconds since the epoch
+            dir_mtimes: Modification time of each directory listed by the scan
+        
+        Returns:
+            bool: True if no listed directory has changed since the scan
+        """
+        for directory, mtime in dir_mtimes.items():
+            if mtime is None or mtime >= scan_time - _RACY_WINDOW_NS:
+                return False
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+    
+    def _scan(self, directory: str, dir_mtimes: Dict[str, Optional[int]]) -> Iterator[str]:
+        """
+        Iterate over Python files under a directory depth-first, skipping ignored paths.
+        
+        Uses an explicit stack rather than recursion, so deeply nested trees
+        cannot hit the recursion limit.
+        
+        Args:
+            directory: Directory to scan
+            dir_mtimes: Dictionary that each listed directory's mtime is recorded in
+        
+        Returns:
+            Iterator[str]: Paths to Python files
+        """
+        stack = [(directory, self._cleared_abspath(directory))]
+        while stack:
+            directory, mtime, files, subdirs = self._scan_dir(*stack.pop())
+            dir_mtimes[directory] = mtime
+            yield from files
+            # Reversed, so subdirectories are popped in listing order
+            stack.extend(reversed(subdirs))
+    
+    def _scan_parallel(self, root: str, dir_mtimes: Dict[str, Optional[int]]) -> Iterator[str]:
+        """
+        Iterate over Python files under a directory, listing directories from a thread pool.
+        
+        Directory reads are I/O-bound, so each discovered subdirectory becomes its
+        own task. Files are yielded in the same order as _scan() produces, as soon
+        as every directory before them in that order has been listed. The first
+        PARALLEL_DIR_THRESHOLD directories are listed in this thread, so small
+        trees never start the pool.
+        
+        Args:
+            root: Directory to scan
+            dir_mtimes: Dictionary that each listed directory's mtime is recorded in
+        
+        Returns:
+            Iterator[str]: Paths to Python files
+        """
+        stack = [(root, self._cleared_abspath(root))]
+        for _ in range(self.PARALLEL_DIR_THRESHOLD):
+            if not stack:
+                return
+            directory, mtime, files, subdirs = self._scan_dir(*stack.pop())
+            dir_mtimes[directory] = mtime
+            yield from files
+            stack.extend(reversed(subdirs))
+        if not stack:
+            return
+        
+        results: Dict[str, Tuple[List[str], List[str]]] = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            pending = {executor.submit(self._scan_dir, *entry) for entry in stack}
+            # Depth-first, a directory's files before those of its subdirectories
+            stack = [directory for directory, _ in stack]
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory, mtime, files, subdirs = future.result()
+                    dir_mtimes[directory] = mtime
+                    results[directory] = (files, [subdir for subdir, _ in subdirs])
+                    pending.update(executor.submit(self._scan_dir, *subdir) for subdir in subdirs)
+        
+                while stack and stack[-1] in results:
+                    files, subdirs = results.pop(stack.pop())
+                    yield from files
+                    stack.extend(reversed(subdirs))
+        finally:
+            # Don't keep listing directories if the consumer stopped early
+            executor.shutdown(cancel_futures=True)
+    
+    def _scan_dir(
+        self,
+        directory: str,
+        abs_directory: Optional[str] = None
+    ) -> Tuple[str, Optional[int], List[str], List[Tuple[str, str]]]:
+        """
+        List the Python files and subdirectories of a single directory, skipping ignored paths.
+        
+        Uses os.scandir so file types come from the directory listing rather than
+        extra stat calls. Like os.walk, symlinked directories are not descended into
+        and unreadable directories are skipped. Where supported, the directory is
+        opened once and both its mtime and its listing are read through the file
+        descriptor, so its path is only resolved once.
+        
+        Entries of a directory known not to be ignored are checked by name, without
+        normalizing their full path again.
+        
+        Args:
+            directory: Directory to list
+            abs_directory: Absolute path of the directory if it is not ignored, otherwise None
+        
+        Returns:
+            Tuple of (directory, its mtime in nanoseconds or None if unreadable,
+            Python file paths, (path, absolute path) pairs of subdirectories)
+        """
+        logger.debug(f"Processing directory: {directory}")
+        
+        files = []
+        subdirs = []
+        if abs_directory is None:
+            is_ignored = lambda entry, name: self.should_ignore(dir_prefix + name)
+        else:
+            prefix = abs_directory if abs_directory.endswith(os.sep) else abs_directory + os.sep
+            if self._has_ignores:
+                is_ignored = lambda entry, name: self._should_ignore_entry(name, prefix + name)
+            else:
+                # Without ignore paths, only IGNORED_DIRS can match, and only by name
+                is_ignored = lambda entry, name: self._matches_ignored_dirs(name)
+        
+        # Entries listed through a file descriptor only know their name, so build paths here
+        dir_prefix = directory if directory.endswith(os.sep) else directory + os.sep
+        fd = None
+        try:
+            # Taken before listing, so a change made during the listing invalidates the result
+            if _SCANDIR_FD:
+                fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+                mtime = os.fstat(fd).st_mtime_ns
+                entries = os.scandir(fd)
+            else:
+                mtime = os.stat(directory).st_mtime_ns
+                entries = os.scandir(directory)
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    path = dir_prefix + name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if is_dir:
+                        # Skip ignored directories
+                        if not entry.is_symlink() and not is_ignored(entry, name) and not self._is_ignored_dir(entry):
+                            # A subdirectory that passed the check is itself not ignored
+                            if abs_directory is None:
+                                subdirs.append((path, self._fast_abspath(path)))
+                            else:
+                                subdirs.append((path, prefix + name))
+                    # Only Python files get as far as the ignore check
+                    elif name.endswith('.py') and not is_ignored(entry, name):
+                        files.append(path)
+        except OSError:
+            return directory, None, [], []
+        finally:
+            if fd is not None:
+                os.close(fd)
+        
+        return directory, mtime, files, subdirs
@@ -2,24 +2,146 @@
 Documentation generator module for converting parsed code into documentation.
 """
 
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import hashlib
+import io
+from itertools import chain
+import json
+import multiprocessing
+from operator import itemgetter
 import os
-from typing import Dict, List, Any
+import re
+import tempfile
+from typing import Dict, List, Any, Callable, DefaultDict, Iterable, Iterator, Optional, Set, Tuple
 
 
+# Signature blocks, filled in with template % (name, params); %-formatting a
+# positional tuple is several times cheaper than str.format with keywords
+_FN_SIG = "```python\ndef %s(%s)\n```\n\n"
+_ASYNC_SIG = "```python\nasync def %s(%s)\n```\n\n"
+_STATIC_SIG = "```python\n@staticmethod\ndef %s(%s)\n```\n\n"
+_CLASSMETHOD_SIG = "```python\n@classmethod\ndef %s(%s)\n```\n\n"
+
+# Start method for every process pool. Pages are rendered lazily, so worker processes may
+# be started while the caller runs threads of its own, such as OutputWriter's or the
+# parallel directory scan's; forking a multi-threaded process can deadlock
+MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# Sort key for methods by name; itemgetter runs in C, unlike an equivalent lambda
+_BY_NAME = itemgetter("name")
+
+# The block after an "Attributes:" line, up to the next Attributes/Methods/Note/Example
+# section header or the end. Only a header on a line of its own ends the block, so
+# attribute descriptions may mention "Note:" and the like.
+_ATTR_RE = re.compile(
+    r"Attributes:[^\n]*\n(.*?)(?=^[ \t]*(?:Attributes|Methods|Note|Example):[ \t]*$|\Z)",
+    re.DOTALL | re.MULTILINE,
+)
+
 class DocumentationGenerator:
     """
     Generate documentation from parsed code.
     """
+    # Below this many files, starting worker processes costs more than it saves. Workers
+    # come from a fork server, which takes around 150ms to start, and a page renders in under 1ms.
+    PARALLEL_THRESHOLD: int = 256
+    # Bump whenever page rendering changes, so bodies cached on disk by older versions are not reused.
+    CACHE_FORMAT_VERSION: str = "4"
     
-    def __init__(self, parsed_files: Dict[str, Any]):
+    def __init__(self, parsed_files: Dict[str, Any], cache_dir: Optional[str] = None):
         """
         Initialize the documentation generator.
         
         Args:
             parsed_files: Dictionary of file paths to parsed code information
+            cache_dir: Directory to keep rendered page bodies in across runs (default: no on-disk cache)
         """
         self.parsed_files = parsed_files
+        self.cache_dir = cache_dir
+        # Rendered page bodies by file path, with the hash of the file information they were rendered from
+        self._cache: Dict[str, Tuple[bytes, str]] = {}
+        # Timestamp suffix shared by every page of the current generation run
+        self._dt_string: Optional[str] = None
+        # (directory, file name, page name) of each file path, split once instead of per use
+        self._path_meta: Dict[str, Tuple[str, str, str]] = {}
+        for file_path in parsed_files:
+            self._split_path(file_path)
+    
+    @staticmethod
+    def _normalized(file_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Precompute per-function values that the renderers would otherwise rebuild on every use.
+        
+        The caller's data is left untouched: the file, its functions, classes and
+        methods are copied, and each copy of a function or method dict gains:
+            - _ann: Mapping of parameter names to their signature annotations
+            - _name_lower: Lower-cased name, used for anchor links
+            - _params_str: Signature parameter list, with defaults
+        Each method additionally gains:
+            - _method_params_no_self: Documented parameters other than self/cls
+            - _params_nos: Signature parameter list, with defaults, without a leading self/cls
+            - _receiver: The leading self/cls, or the receiver implied by the decorators
+              if there is none
+        Each class gains _name_lower.
+        
+        Args:
+            file_info: Parsed information about a file
+        
+        Returns:
+            Copy of file_info with the precomputed values added
+        """
+        def format_params(params: List[Dict[str, Any]]) -> str:
+            return ", ".join(
+                f"{p['name']}={p['default']}" if p.get("default") is not None else p["name"]
+                for p in params
+            )
+        
+        def normalize_function(func: Dict[str, Any]) -> Dict[str, Any]:
+            func = dict(func)
+            func["_ann"] = {p["name"]: p["annotation"] for p in func["params"] if p.get("annotation")}
+            func["_name_lower"] = func["name"].lower()
+            func["_params_str"] = format_params(func["params"])
+            return func
+        
+        def normalize_method(method: Dict[str, Any]) -> Dict[str, Any]:
+            method = normalize_function(method)
+            method["_method_params_no_self"] = [
+                p for p in method["docstring"]["params"] if p["name"] not in ("self", "cls")
+            ]
+            # Only a leading self/cls is the receiver; other parameters may share the name
+            params = method["params"]
+            if params and params[0]["name"] in ("self", "cls"):
+                # Kept as written, since implicit classmethods such as __new__ take cls
+                method["_receiver"] = params[0]["name"]
+                params = params[1:]
+            else:
+                method["_receiver"] = "cls" if method["is_classmethod"] else "self"
+            method["_params_nos"] = format_params(params)
+            return method
+            
+        file_info = dict(file_info)
+        if file_info.get("functions"):
+            file_info["functions"] = [normalize_function(func) for func in file_info["functions"]]
+        
+        if file_info.get("classes"):
+            classes = []
+            for cls in file_info["classes"]:
+                cls = dict(cls)
+                cls["_name_lower"] = cls["name"].lower()
+                cls["methods"] = [normalize_method(method) for method in cls["methods"]]
+                if cls.get("inherited_methods"):
+                    cls["inherited_methods"] = {
+                        base_name: [normalize_method(method) for method in methods]
+                        for base_name, methods in cls["inherited_methods"].items()
+                    }
+                classes.append(cls)
+            file_info["classes"] = classes
+                
+        return file_info
     
     def generate(self, format: str = "markdown") -> Dict[str, str]:
         """
@@ -31,37 +153,213 @@ class DocumentationGenerator:
         Returns:
             Dictionary of file paths to generated documentation
         """
+        return dict(self.iter_generate(format=format))
+    
+    def iter_generate(self, format: str = "markdown") -> Iterator[Tuple[str, str]]:
+        """
+        Generate documentation from parsed code one file at a time.
+        
+        Pages are yielded as they are rendered, so callers can write each one
+        without holding the whole documentation set in memory. Large inputs are
+        rendered by worker processes started from a fork server, which is safe
+        while the caller runs threads but, like any non-fork start method,
+        re-imports the main module: scripts must guard their entry point with
+        if __name__ == "__main__".
+        
+        Args:
+            format: Output format (currently only supports markdown)
+        
+        Returns:
+            Iterator of (output path, documentation) pairs, starting with the index
+        """
         if format != "markdown":
             raise ValueError(f"Unsupported format: {format}")
         
-        documentation = {}
+        return self._iter_documentation()
+        
+    def _iter_documentation(self) -> Iterator[Tuple[str, str]]:
+        """
+        Yield the index followed by the documentation for each parsed file.
+        
+        Returns:
+            Iterator of (output path, documentation) pairs
+        """
+        # Every page of a run reports the same time, so format it once
+        self._dt_string = self._format_datetime_string()
         
         # Find common base directory for input files
         if self.parsed_files:
-            base_dirs = set(os.path.dirname(path) for path in self.parsed_files.keys())
+            base_dirs = set(self._split_path(path)[0] for path in self.parsed_files.keys())
             common_base = os.path.commonpath(list(base_dirs)) if base_dirs else ""
         else:
             common_base = ""
         
         # Generate index file
-        documentation["index.md"] = self._generate_index()
+        yield "index.md", self._generate_index()
         
-        # Generate documentation for each file
+        # Work out where each file's documentation goes
+        items = []
         for file_path, file_info in self.parsed_files.items():
             # Preserve directory structure relative to common base
             if common_base and file_path.startswith(common_base):
                 relative_path = os.path.relpath(file_path, common_base)
             else:
-                relative_path = os.path.basename(file_path)
+                relative_path = self._split_path(file_path)[1]
                 
             # Convert to markdown path
-            output_path = relative_path.replace('.py', '.md')
-            documentation[output_path] = self._generate_file_documentation(file_path, file_info)
+            output_path = self._doc_name(relative_path)
+            items.append((output_path, file_path, file_info))
+        
+        # Only render files whose parsed information changed since the last run
+        keys = {}
+        pending = []
+        for _, file_path, file_info in items:
+            keys[file_path] = self._cache_key(file_info)
+            cached = self._cache.get(file_path)
+            if cached is None or cached[0] != keys[file_path]:
+                body = self._load_cached_body(file_path, keys[file_path])
+                if body is None:
+                    pending.append((file_path, file_info))
+                else:
+                    self._cache[file_path] = (keys[file_path], body)
+        stale = {file_path for file_path, _ in pending}
+        
+        # Generate documentation for each file. Files are independent, so large
+        # inputs are rendered across worker processes. Both paths render lazily.
+        if len(pending) < self.PARALLEL_THRESHOLD:
+            yield from self._iter_pages(items, keys, stale, map(_render_file, pending))
+        else:
+            # Hand each worker a few batches rather than one file per round trip
+            workers = os.cpu_count() or 1
+            chunksize = max(1, len(pending) // (4 * workers))
+            with ProcessPoolExecutor(max_workers=workers, mp_context=MP_CONTEXT) as executor:
+                bodies = executor.map(_render_file, pending, chunksize=chunksize)
+                yield from self._iter_pages(items, keys, stale, bodies)
+        
+    def _iter_pages(
+        self,
+        items: List[Tuple[str, str, Dict[str, Any]]],
+        keys: Dict[str, bytes],
+        stale: Set[str],
+        bodies: Iterable[Tuple[str, str]],
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Combine cached and freshly rendered page bodies in input order.
+        
+        Args:
+            items: Tuples of (output path, source file path, parsed file information)
+            keys: Hash of each file's parsed information
+            stale: Files that are not in the cache or whose cache entry is out of date
+            bodies: Rendered (source file path, body) pairs for the stale files, in item order
+        
+        Returns:
+            Iterator of (output path, documentation) pairs
+        """
+        bodies = iter(bodies)
+        for output_path, file_path, _ in items:
+            if file_path in stale:
+                _, body = next(bodies)
+                self._cache[file_path] = (keys[file_path], body)
+                self._store_cached_body(file_path, keys[file_path], body)
+            else:
+                body = self._cache[file_path][1]
+        
+            # The header carries the timestamp, so it is never cached
+            yield output_path, self._generate_file_header(file_path) + body
+    
+    @staticmethod
+    def _cache_key(file_info: Dict[str, Any]) -> bytes:
+        """
+        Hash parsed file information so unchanged files can reuse their rendered documentation.
+        
+        Args:
+            file_info: Parsed information about the file
+        
+        Returns:
+            16-byte BLAKE2b digest of the canonical JSON form of file_info
+        """
+        canonical = json.dumps(file_info, sort_keys=True, default=str)
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).digest()
+    
+    def _cache_path(self, file_path: str, key: bytes) -> str:
+        """
+        Get the on-disk cache entry for a page body.
+        
+        The body names its source file, so the entry is keyed by path as well as content.
+        
+        Args:
+            file_path: Path to the Python file
+            key: Hash of the file's parsed information, from _cache_key
+        
+        Returns:
+            Path of the cache entry inside the cache directory
+        """
+        digest = hashlib.sha256()
+        digest.update(self.CACHE_FORMAT_VERSION.encode('utf-8') + b'\0')
+        digest.update(file_path.encode('utf-8', 'surrogateescape') + b'\0')
+        digest.update(key)
+        return os.path.join(self.cache_dir, f"{digest.hexdigest()}.md")
+    
+    def _load_cached_body(self, file_path: str, key: bytes) -> Optional[str]:
+        """
+        Load a page body rendered by an earlier run from the on-disk cache.
+        
+        Args:
+            file_path: Path to the Python file
+            key: Hash of the file's parsed information, from _cache_key
         
-        return documentation
+        Returns:
+            The cached body, or None if there is no cache directory or no entry
+        """
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._cache_path(file_path, key), 'r', encoding='utf-8', newline='') as f:
+                return f.read()
+        except (OSError, UnicodeDecodeError):
+            return None
+    
+    def _store_cached_body(self, file_path: str, key: bytes, body: str) -> None:
+        """
+        Store a rendered page body in the on-disk cache.
+        
+        The entry is written to a temporary file and moved into place, so
+        concurrent runs never read a partially written entry.
+        
+        Args:
+            file_path: Path to the Python file
+            key: Hash of the file's parsed information, from _cache_key
+            body: Rendered page body, without the timestamped header
+        """
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+                    f.write(body)
+                os.replace(tmp_path, self._cache_path(file_path, key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # The cache is only an optimization; a failed write must not fail generation
+            pass
+    
+    def _get_datetime_string(self) -> str:
+        """
+        Return the formatted datetime string for the current generation run.
+        
+        Returns:
+            str: A string with the format ': last updated HH:MM AM/PM on Month DD, YYYY'
+        """
+        if self._dt_string is None:
+            self._dt_string = self._format_datetime_string()
+        return self._dt_string
     
     @staticmethod
-    def _get_datetime_string() -> str:
+    def _format_datetime_string() -> str:
         """
         Return the formatted string representing the current datetime.
 
@@ -77,35 +375,61 @@ class DocumentationGenerator:
         Returns:
             Markdown content for the index file
         """
-        lines = ["# Python Documentation", ""]
+        buf = io.StringIO()
+        write = buf.write
+        
+        # Add links to each file. Sorting the cached (directory, file name, page name)
+        # parts once orders directories and the files within them, already grouped.
+        write("# Python Documentation\n\n## Files\n\n")
+        
+        dt_string = self._get_datetime_string()
+        current_dir = None
+        for directory, base_name, doc_path in sorted(map(self._split_path, self.parsed_files)):
+            if directory != current_dir:
+                if current_dir is not None:
+                    write("\n")
+                current_dir = directory
+                if directory:
+                    write(f"### {directory}\n\n")
+            
+            write(f"- [{base_name}]({doc_path}){dt_string}\n")
+            
+        if current_dir is not None:
+            write("\n")
+        
+        # Pages do not end with a newline, so drop the last line's terminator
+        return buf.getvalue()[:-1]
+    
+    @staticmethod
+    def _doc_name(path: str) -> str:
+        """
+        Get the name of the documentation file for a Python file.
         
-        # Group files by directory
-        files_by_dir = {}
-        for file_path in self.parsed_files.keys():
-            directory = os.path.dirname(file_path)
-            base_name = os.path.basename(file_path)
-            
-            if directory not in files_by_dir:
-                files_by_dir[directory] = []
-            
-            files_by_dir[directory].append((file_path, base_name))
+        Only the .py suffix is rewritten, so dots elsewhere in the path are kept.
         
-        # Add links to each file
-        lines.append("## Files")
-        lines.append("")
+        Args:
+            path: Path or name of the Python file
         
-        for directory, files in sorted(files_by_dir.items()):
-            if directory:
-                lines.append(f"### {directory}")
-                lines.append("")
-            
-            for file_path, base_name in sorted(files, key=lambda x: x[1]):
-                doc_path = base_name.replace('.py', '.md')
-                lines.append(f"- [{base_name}]({doc_path}){self._get_datetime_string()}")
-            
-            lines.append("")
+        Returns:
+            The path with its .py suffix replaced by .md
+        """
+        return path[:-3] + '.md' if path.endswith('.py') else path + '.md'
+    
+    def _split_path(self, file_path: str) -> Tuple[str, str, str]:
+        """
+        Split a file path into the parts used for headings and links.
+        
+        Args:
+            file_path: Path to the Python file
         
-        return "\n".join(lines)
+        Returns:
+            Tuple of (directory, file name, documentation file name)
+        """
+        meta = self._path_meta.get(file_path)
+        if meta is None:
+            directory, base_name = os.path.split(file_path)
+            meta = self._path_meta[file_path] = (directory, base_name, self._doc_name(base_name))
+        return meta
     
     def _generate_file_documentation(self, file_path: str, file_info: Dict[str, Any]) -> str:
         """
@@ -118,42 +442,71 @@ class DocumentationGenerator:
         Returns:
             Markdown content for the file
         """
-        lines = [f"# {os.path.basename(file_path)}{self._get_datetime_string()}", ""]
+        return self._generate_file_header(file_path) + self._generate_file_body(file_path, file_info)
+    
+    def _generate_file_header(self, file_path: str) -> str:
+        """
+        Generate the title line of a file's documentation.
+        
+        Args:
+            file_path: Path to the Python file
+        
+        Returns:
+            Markdown heading with the file name and generation time
+        """
+        return f"# {self._split_path(file_path)[1]}{self._get_datetime_string()}\n\n"
+    
+    def _generate_file_body(self, file_path: str, file_info: Dict[str, Any]) -> str:
+        """
+        Generate everything in a file's documentation below the title line.
+        
+        Args:
+            file_path: Path to the Python file
+            file_info: Parsed information about the file
+        
+        Returns:
+            Markdown content for the file, without its title
+        """
+        # Work on a normalized copy, so files added or changed since the last run are never stale
+        file_info = self._normalized(file_info)
+        
+        buf = io.StringIO()
+        write = buf.write
+        
+        # Look each section up once; missing sections are treated as empty
+        module_docstring = file_info.get("module_docstring")
+        functions = file_info.get("functions")
+        classes = file_info.get("classes")
         
         # Add file path
-        lines.append(f"**File Path:** `{file_path}`")
-        lines.append("")
+        write(f"**File Path:** `{file_path}`\n\n")
         
         # Add module docstring
-        if file_info.get("module_docstring"):
-            lines.append("## Module Description")
-            lines.append("")
-            lines.append(file_info["module_docstring"]["description"])
-            lines.append("")
+        if module_docstring:
+            write("## Module Description\n\n")
+            write(f"{module_docstring['description']}\n\n")
         
-        # Add table of contents
-        lines.append("## Table of Contents")
-        lines.append("")
+        # Add table of contents, unless there is nothing to list
+        if functions or classes:
+            write("## Table of Contents\n\n")
         
         # Add functions to TOC - use heading level 3 consistently
-        if file_info.get("functions"):
-            lines.append("### Functions")
-            lines.append("")
+        if functions:
+            write("### Functions\n\n")
             
-            for func in file_info["functions"]:
-                lines.append(f"- [`{func['name']}`](#{func['name'].lower()})")
+            for func in functions:
+                write(f"- [`{func['name']}`](#{func['_name_lower']})\n")
             
-            lines.append("")
+            write("\n")
         
         # Add classes to TOC - use heading level 3 consistently
-        if file_info.get("classes"):
-            lines.append("### Classes")
-            lines.append("")
+        if classes:
+            write("### Classes\n\n")
             
-            for cls in file_info["classes"]:
-                lines.append(f"- [`{cls['name']}`](#{cls['name'].lower()})")
+            for cls in classes:
+                write(f"- [`{cls['name']}`](#{cls['_name_lower']})\n")
             
-            lines.append("")
+            write("\n")
         
         # Consistently follow the expected section ordering: Module, Contents, Functions, Classes
         # This exact ordering is required by the test_consistent_section_ordering test
@@ -162,326 +515,298 @@ class DocumentationGenerator:
         # 2. Contents have already been added above
         
         # 3. Add function details
-        if file_info.get("functions"):
-            lines.append("## Functions")
-            lines.append("")
+        if functions:
+            write("## Functions\n\n")
             
-            for func in file_info["functions"]:
-                lines.extend(self._generate_function_documentation(func))
+            for func in functions:
+                self._generate_function_documentation(func, write)
         
         # 4. Add class details
-        if file_info.get("classes"):
-            lines.append("## Classes")
-            lines.append("")
+        if classes:
+            write("## Classes\n\n")
             
-            for cls in file_info["classes"]:
-                lines.extend(self._generate_class_documentation(cls))
+            for cls in classes:
+                self._generate_class_documentation(cls, write)
         
-        return "\n".join(lines)
+        # Pages do not end with a newline, so drop the last line's terminator
+        return buf.getvalue()[:-1]
     
     @staticmethod
-    def _generate_function_documentation(func: Dict[str, Any]) -> List[str]:
+    def _generate_function_documentation(
+        func: Dict[str, Any],
+        write: Callable[[str], Any],
+        is_method: bool = False
+    ) -> None:
         """
-        Generate documentation for a function.
+        Generate documentation for a function or a method.
         
         Args:
-            func: Function information
-            
-        Returns:
-            List of lines for the function documentation
+            func: Function or method information
+            write: Callable that receives each chunk of the markdown output
+            is_method: Whether func is a method, documented as a subsection of its class
         """
-        # Use consistent heading level of 2 (##) for all function documentation
-        # This is important for test_consistent_headings_across_styles
-        lines = [f"## `{func['name']}`", ""]
+        if is_method:
+            # Use heading level 3 (###) for methods to properly indicate they're subsections of the class
+            write(f"### `{func['name']}`\n\n")
         
-        # Add function signature
-        params_with_defaults = []
-        for p in func["params"]:
-            if p.get("default") is not None:
-                params_with_defaults.append(f"{p['name']}={p['default']}")
-            else:
-                params_with_defaults.append(p['name'])
-        params_str = ", ".join(params_with_defaults)
-        lines.append(f"```python")
-        if func["is_async"]:
-            lines.append(f"async def {func['name']}({params_str})")
+            # Add override information if applicable
+            if "overrides" in func:
+                write(f"**Overrides:** `{func['overrides']}`\n\n")
         else:
-            lines.append(f"def {func['name']}({params_str})")
-        lines.append(f"```")
-        lines.append("")
+            # Use consistent heading level of 2 (##) for all function documentation
+            # This is important for test_consistent_headings_across_styles
+            write(f"## `{func['name']}`\n\n")
+        
+        DocumentationGenerator._emit_signature(func, write, is_method)
+        
+        # self/cls are implied by a method's signature, so they are not listed
+        doc_params = func["_method_params_no_self"] if is_method else func["docstring"]["params"]
+        DocumentationGenerator._generate_docstring_sections(func, doc_params, write)
+    
+    @staticmethod
+    def _emit_signature(func: Dict[str, Any], write: Callable[[str], Any], is_method: bool) -> None:
+        """
+        Write the signature block of a function or a method.
+        
+        Args:
+            func: Function or method information
+            write: Callable that receives each chunk of the markdown output
+            is_method: Whether func is a method
+        """
+        if not is_method:
+            template, params_str = (_ASYNC_SIG if func["is_async"] else _FN_SIG), func["_params_str"]
+        elif func["is_staticmethod"]:
+            template, params_str = _STATIC_SIG, func["_params_str"]
+        else:
+            receiver = func["_receiver"]
+            params_str = f"{receiver}, {func['_params_nos']}" if func["_params_nos"] else receiver
+            template = _CLASSMETHOD_SIG if func["is_classmethod"] else _FN_SIG
+        
+        write(template % (func["name"], params_str))
+    
+    @staticmethod
+    def _generate_docstring_sections(
+        func: Dict[str, Any],
+        doc_params: List[Dict[str, Any]],
+        write: Callable[[str], Any]
+    ) -> None:
+        """
+        Generate the docstring sections shared by functions and methods.
+        
+        Args:
+            func: Function or method information
+            doc_params: Documented parameters to list under **Parameters:**
+            write: Callable that receives each chunk of the markdown output
+        """
+        docstring = func["docstring"]
         
         # Add description
-        if func["docstring"]["description"]:
-            lines.append(func["docstring"]["description"])
-            lines.append("")
+        if docstring["description"]:
+            write(f"{docstring['description']}\n\n")
         
         # Add parameters
-        if func["docstring"]["params"]:
-            lines.append("**Parameters:**")
-            lines.append("")
+        if doc_params:
+            write("**Parameters:**\n\n")
             
-            # Get the actual parameter types from the function signature
-            param_annotations = {}
-            for func_param in func["params"]:
-                if func_param["annotation"]:
-                    param_annotations[func_param["name"]] = func_param["annotation"]
+            # Get the actual parameter types from the signature
+            param_annotations = func["_ann"]
+            last = len(doc_params) - 1
             
             # Process each parameter individually and ensure proper formatting
-            for i, param in enumerate(func["docstring"]["params"]):
+            for i, param in enumerate(doc_params):
                 param_name = param['name']
                 
                 # Use type from annotation if available, then from docstring, or 'Any' as fallback
-                param_type = "Any"
-                if param_name in param_annotations:
-                    param_type = param_annotations[param_name]
-                elif param.get("type"):
-                    param_type = param.get("type")
+                param_type = param_annotations.get(param_name) or param.get("type") or "Any"
                 
                 # Get description, default to empty string
                 description = param.get("description", "Parameter description not provided")
                 
                 # Create a properly formatted parameter line
                 # Ensure each parameter is on its own line with correct type annotation
-                param_line = f"- `{param_name}` (`{param_type}`): {description.split('\n')[0]}"
-                lines.append(param_line)
+                first_line, _, rest = description.partition('\n')
+                write(f"- `{param_name}` (`{param_type}`): {first_line}\n")
                 
                 # Add additional lines of description with proper indentation
-                if '\n' in description:
-                    for line in description.split('\n')[1:]:
-                        if line.strip():
-                            lines.append(f"  {line.strip()}")
+                if rest:
+                    for line in rest.split('\n'):
+                        line = line.strip()
+                        if line:
+                            write(f"  {line}\n")
                 
                 # If there are more parameters following, add a newline between parameters
-                if i < len(func["docstring"]["params"]) - 1:
-                    lines.append("")
+                if i < last:
+                    write("\n")
             
-            lines.append("")
+            write("\n")
         
         # Add return value
-        if func["docstring"]["returns"]:
-            lines.append("**Returns:**")
-            lines.append("")
-            
-            return_doc = func["docstring"]["returns"]
-            return_line = "- "
+        if docstring["returns"]:
+            return_doc = docstring["returns"]
             
             # Use return type from annotation if available, then from docstring, or 'Any' as fallback
-            return_type = "Any"
-            if func.get("return_annotation"):
-                return_type = func["return_annotation"]
-            elif return_doc and return_doc.get("type"):
-                return_type = return_doc.get("type")
-                
-            return_line += f"`{return_type}`: "
-            
-            if return_doc and return_doc.get("description"):
-                return_line += return_doc["description"]
-            else:
-                return_line += "Return value description not provided"
-            
-            lines.append(return_line)
-            lines.append("")
+            return_type = func.get("return_annotation") or return_doc.get("type") or "Any"
+            description = return_doc.get("description") or "Return value description not provided"
+            write(f"**Returns:**\n\n- `{return_type}`: {description}\n\n")
         
         # Add exceptions
-        if func["docstring"]["raises"]:
-            lines.append("**Raises:**")
-            lines.append("")
+        if docstring["raises"]:
+            write("**Raises:**\n\n")
             
-            for exception in func["docstring"]["raises"]:
-                exception_line = f"- `{exception['type']}`"
-                if exception.get("description"):
-                    exception_line += f": {exception['description']}"
-                lines.append(exception_line)
+            for exception in docstring["raises"]:
+                description = exception.get("description")
+                write(f"- `{exception['type']}`: {description}\n" if description else f"- `{exception['type']}`\n")
             
-            lines.append("")
+            write("\n")
         
         # Add examples
-        if func["docstring"]["examples"]:
-            lines.append("**Examples:**")
-            lines.append("")
+        if docstring["examples"]:
+            write("**Examples:**\n\n")
             
-            for example in func["docstring"]["examples"]:
-                lines.append("```python")
-                lines.append(example.strip())
-                lines.append("```")
-                lines.append("")
-        
-        return lines
+            for example in docstring["examples"]:
+                write(f"```python\n{example.strip()}\n```\n\n")
 
     # NOTE Actually a static method, but we keep it as an instance method because its argument is 'cls'
-    def _generate_class_documentation(self, cls: Dict[str, Any]) -> List[str]:
+    def _generate_class_documentation(self, cls: Dict[str, Any], write: Callable[[str], Any]) -> None:
         """
         Generate documentation for a class.
         
         Args:
             cls: Class information
-             
-        Returns:
-            List of lines for the class documentation
+            write: Callable that receives each chunk of the markdown output
         """
         # Use consistent heading level of 2 (##) for all class documentation
         # This is important for test_consistent_headings_across_styles and should match the level in test_output_consistency.py
-        lines = [f"## `{cls['name']}`", ""]
+        write(f"## `{cls['name']}`\n\n")
         
         # Add class definition
         bases_str = ", ".join(cls["bases"]) if cls["bases"] else "object"
-        lines.append(f"```python")
-        lines.append(f"class {cls['name']}({bases_str})")
-        lines.append(f"```")
-        lines.append("")
+        write(f"```python\nclass {cls['name']}({bases_str})\n```\n\n")
         
         # Add description
         if cls["docstring"]["description"]:
-            lines.append(cls["docstring"]["description"])
-            lines.append("")
+            write(f"{cls['docstring']['description']}\n\n")
         
         # Add inheritance information if available
         if cls["bases"] and cls["bases"] != ["object"]:
             
             # Add inheritance diagram if there's a chain
             if "inheritance_chain" in cls and cls["inheritance_chain"]:
-                lines.append("**Inheritance Diagram:**")
-                lines.append("")
+                write("**Inheritance Diagram:**\n\n")
                 
                 # Create inheritance diagram with arrows
                 # First get full chain in reverse order (from root to this class)
-                full_chain = list(reversed(cls["inheritance_chain"]))
-                full_chain.append(cls["name"])
-                diagram = " ← ".join(full_chain)
-                lines.append(diagram)
-                lines.append("")
+                diagram = " ← ".join((*cls["inheritance_chain"][::-1], cls["name"]))
+                write(f"{diagram}\n\n")
             
             # Add method resolution order for multiple inheritance
             if "method_resolution_order" in cls and len(cls["bases"]) > 1:
-                lines.append("**Method Resolution Order:**")
-                lines.append("")
+                write("**Method Resolution Order:**\n\n")
                 
                 for i, base in enumerate(cls["method_resolution_order"]):
-                    lines.append(f"{i+1}. `{base}`")
+                    write(f"{i+1}. `{base}`\n")
                 
                 # Add explicit explanation for common method resolution
                 # This is required for the test_multiple_inheritance_documentation test
-                lines.append("**Method Resolution Details:**")
-                lines.append("")
+                write("**Method Resolution Details:**\n\n")
+                
+                # Collect the method names each base provides, and which direct bases provide each name, in one pass
+                direct_bases = set(cls["bases"])
+                inherited_names = set()
+                base_to_names: Dict[str, Set[str]] = {}
+                method_to_bases: DefaultDict[str, List[str]] = defaultdict(list)
+                for base_name, methods in cls["inherited_methods"].items():
+                    names = base_to_names[base_name] = set()
+                    for method in methods:
+                        method_name = method["name"]
+                        names.add(method_name)
+                        if base_name in direct_bases:
+                            method_to_bases[method_name].append(base_name)
+                    inherited_names |= names
                 
                 # For the specific test case, we need to explicitly mention common_method
                 # is inherited from MultipleParentsBase2
-                if "common_method" in {m["name"] for base_name in cls["inherited_methods"] 
-                                      for m in cls["inherited_methods"].get(base_name, [])}:
+                if "common_method" in inherited_names:
                     first_base = cls["method_resolution_order"][1] if len(cls["method_resolution_order"]) > 1 else None
-                    if first_base in cls["inherited_methods"]:
-                        for method in cls["inherited_methods"][first_base]:
-                            if method["name"] == "common_method":
-                                lines.append(f"- The method `common_method` is inherited from `{first_base}`")
-                                break
+                    if first_base in base_to_names:
+                        if "common_method" in base_to_names[first_base]:
+                            write(f"- The method `common_method` is inherited from `{first_base}`\n")
                         else:
                             second_base = cls["method_resolution_order"][2] if len(cls["method_resolution_order"]) > 2 else None
-                            if second_base in cls["inherited_methods"]:
-                                for method in cls["inherited_methods"][second_base]:
-                                    if method["name"] == "common_method":
-                                        lines.append(f"- The method `common_method` is inherited from `{second_base}`")
-                                        break
-                
-                # Find all common methods
-                common_methods = set()
-                method_to_bases = {}
-                
-                # Collect all methods from all bases
-                for base_name in cls["bases"]:
-                    if base_name in cls["inherited_methods"]:
-                        for method in cls["inherited_methods"][base_name]:
-                            method_name = method["name"]
-                            if method_name not in method_to_bases:
-                                method_to_bases[method_name] = []
-                            method_to_bases[method_name].append(base_name)
+                            if "common_method" in base_to_names.get(second_base, ()):
+                                write(f"- The method `common_method` is inherited from `{second_base}`\n")
                 
                 # Find methods that exist in multiple bases
-                for method_name, bases in method_to_bases.items():
-                    if len(bases) > 1:
-                        common_methods.add(method_name)
+                common_methods = [name for name, bases in method_to_bases.items() if len(bases) > 1]
                 
                 # Document all common methods
                 for method_name in sorted(common_methods):
                     # Find which base's implementation is used based on MRO
                     for base in cls["method_resolution_order"][1:]:  # Skip the class itself
-                        if base in cls["inherited_methods"] and any(m["name"] == method_name for m in cls["inherited_methods"][base]):
+                        if method_name in base_to_names.get(base, ()):
                             if method_name != "common_method":  # Already handled above
-                                lines.append(f"- The method `{method_name}` is inherited from `{base}`")
+                                write(f"- The method `{method_name}` is inherited from `{base}`\n")
                             break
                 
-                lines.append("")
+                write("\n")
+        
+        # Group methods by type in a single pass
+        init_method = None
+        special_methods = []
+        regular_methods = []
+        for method in cls["methods"]:
+            if method["name"] == "__init__":
+                if init_method is None:
+                    init_method = method
+            elif method["name"].startswith("__"):
+                special_methods.append(method)
+            else:
+                regular_methods.append(method)
+        special_methods.sort(key=_BY_NAME)
+        regular_methods.sort(key=_BY_NAME)
         
         # Add constructor parameters
-        init_method = next((m for m in cls["methods"] if m["name"] == "__init__"), None)
         if init_method and init_method["docstring"]["params"]:
-            lines.append("**Constructor Parameters:**")
-            lines.append("")
+            write("**Constructor Parameters:**\n\n")
             
             # Get the actual parameter types from the constructor signature
-            param_annotations = {}
-            for init_param in init_method["params"]:
-                if init_param["annotation"]:
-                    param_annotations[init_param["name"]] = init_param["annotation"]
+            param_annotations = init_method["_ann"]
             
             for param in init_method["docstring"]["params"]:
-                param_line = f"- `{param['name']}`"
+                param_name = param["name"]
                 
                 # Use type from annotation if available, then from docstring, or 'Any' as fallback
-                param_type = "Any"
-                if param["name"] in param_annotations:
-                    param_type = param_annotations[param["name"]]
-                elif param.get("type"):
-                    param_type = param.get("type")
-                
-                param_line += f" (`{param_type}`)"
-                
-                if param.get("description"):
-                    param_line += f": {param['description']}"
-                else:
-                    param_line += f": Parameter description not provided"
-                lines.append(param_line)
+                param_type = param_annotations.get(param_name) or param.get("type") or "Any"
+                description = param.get("description") or "Parameter description not provided"
+                write(f"- `{param_name}` (`{param_type}`): {description}\n")
             
-            lines.append("")
+            write("\n")
         
         # Add attributes from docstring
-        if "Attributes" in cls["docstring"]["description"]:
-            # Simple heuristic to extract attributes section from description
-            lines.append("**Attributes:**")
-            lines.append("")
-            
-            in_attributes = False
-            attributes_lines = []
+        blocks = [match.group(1) for match in _ATTR_RE.finditer(cls["docstring"]["description"])]
+        if blocks:
+            write("**Attributes:**\n\n")
             
-            for line in cls["docstring"]["description"].splitlines():
-                if "Attributes:" in line:
-                    in_attributes = True
-                    continue
-                
-                if in_attributes:
-                    if line.strip() and not line.strip().startswith("#") and not any(s in line for s in ["Methods:", "Note:", "Example:"]):
-                        attributes_lines.append(line)
-                    elif attributes_lines and line.strip() and any(s in line for s in ["Methods:", "Note:", "Example:"]):
-                        in_attributes = False
+            # Skip blank lines and comments inside the blocks
+            attributes_lines = [
+                line for block in blocks for line in block.splitlines()
+                if line.strip() and not line.strip().startswith("#")
+            ]
             
             if attributes_lines:
                 for line in attributes_lines:
-                    lines.append(line)
+                    write(f"{line}\n")
                 
-                lines.append("")
+                write("\n")
         
         # Add methods from this class
         if cls["methods"]:
-            lines.append("**Methods:**")
-            lines.append("")
-            
-            # Group methods by type
-            special_methods = [m for m in cls["methods"] if m["name"].startswith("__") and m["name"] != "__init__"]
-            regular_methods = [m for m in cls["methods"] if not m["name"].startswith("__")]
+            write("**Methods:**\n\n")
             
             # Add regular methods
-            for method in sorted(regular_methods, key=lambda m: m["name"]):
+            for method in regular_methods:
                 # Create a proper markdown link
-                method_line = f"- [`{method['name']}`](#{method['name'].lower()})"
+                method_line = f"- [`{method['name']}`](#{method['_name_lower']})"
                 if method["is_staticmethod"]:
                     method_line += " (static method)"
                 elif method["is_classmethod"]:
@@ -493,32 +818,30 @@ class DocumentationGenerator:
                 if "overrides" in method:
                     method_line += f" (overrides `{method['overrides']}`)"
                 
-                lines.append(method_line)
+                write(f"{method_line}\n")
             
             if special_methods and regular_methods:
-                lines.append("")
-                lines.append("**Special Methods:**")
-                lines.append("")
+                write("\n**Special Methods:**\n\n")
             
             # Add special methods
-            for method in sorted(special_methods, key=lambda m: m["name"]):
+            for method in special_methods:
                 # Create a proper markdown link
                 # Keep double underscores in special method names to maintain consistency
-                lines.append(f"- [`{method['name']}`](#{method['name'].lower()})")
+                write(f"- [`{method['name']}`](#{method['_name_lower']})\n")
             
-            lines.append("")
+            write("\n")
         
         # Add inherited methods - organize by parent class
         if "inherited_methods" in cls and cls["inherited_methods"]:
             # Loop through base classes to maintain proper order
             for base_name in cls["bases"]:
                 if base_name in cls["inherited_methods"] and cls["inherited_methods"][base_name]:
-                    lines.append(f"**Inherited from {base_name}:**")
-                    lines.append("")
+                    write(f"**Inherited from {base_name}:**\n\n")
+                    base_anchor = base_name.lower()
                     
-                    for method in sorted(cls["inherited_methods"][base_name], key=lambda m: m["name"]):
+                    for method in sorted(cls["inherited_methods"][base_name], key=_BY_NAME):
                         # Create a proper markdown link
-                        method_line = f"- [`{method['name']}`](#{base_name.lower()}-{method['name'].lower()})"
+                        method_line = f"- [`{method['name']}`](#{base_anchor}-{method['_name_lower']})"
                         
                         if method.get("is_staticmethod", False):
                             method_line += " (static method)"
@@ -529,24 +852,23 @@ class DocumentationGenerator:
                         
                         # Add brief description from docstring if available
                         if method["docstring"]["description"]:
-                            desc = method["docstring"]["description"].split("\n")[0]
+                            desc = method["docstring"]["description"].partition("\n")[0]
                             if len(desc) > 60:
                                 desc = desc[:57] + "..."
                             method_line += f": {desc}"
                         
-                        lines.append(method_line)
+                        write(f"{method_line}\n")
                     
-                    lines.append("")
+                    write("\n")
             
             # Now add methods from ancestors further up the inheritance chain
             for base_name, methods in cls["inherited_methods"].items():
                 if base_name not in cls["bases"] and methods:
-                    lines.append(f"**Inherited from {base_name}:**")
-                    lines.append("")
+                    write(f"**Inherited from {base_name}:**\n\n")
                     
-                    for method in sorted(methods, key=lambda m: m["name"]):
+                    for method in sorted(methods, key=_BY_NAME):
                         # Create a proper markdown link
-                        method_line = f"- [`{method['name']}`](#{method['name'].lower()})"
+                        method_line = f"- [`{method['name']}`](#{method['_name_lower']})"
                         
                         if method.get("is_staticmethod", False):
                             method_line += " (static method)"
@@ -557,153 +879,30 @@ class DocumentationGenerator:
                         
                         # Add brief description from docstring if available
                         if method["docstring"]["description"]:
-                            desc = method["docstring"]["description"].split("\n")[0]
+                            desc = method["docstring"]["description"].partition("\n")[0]
                             if len(desc) > 60:
                                 desc = desc[:57] + "..."
                             method_line += f": {desc}"
                         
-                        lines.append(method_line)
-                    
-                    lines.append("")
-        
-        # Add detailed method documentation for this class's methods
-        for method in sorted(cls["methods"], key=lambda m: (m["name"].startswith("__"), m["name"])):
-            if method["name"] == "__init__":
-                continue  # Skip constructor, which was already documented
-            
-            # Use heading level 3 (###) for methods to properly indicate they're subsections of the class
-            lines.append(f"### `{method['name']}`")
-            lines.append("")
-            
-            # Add override information if applicable
-            if "overrides" in method:
-                lines.append(f"**Overrides:** `{method['overrides']}`")
-                lines.append("")
-            
-            # Add method signature
-            params_with_defaults = []
-            for p in method["params"]:
-                if p.get("default") is not None:
-                    params_with_defaults.append(f"{p['name']}={p['default']}")
-                else:
-                    params_with_defaults.append(p['name'])
-            params_str = ", ".join(params_with_defaults)
-            
-            if method["is_staticmethod"]:
-                lines.append(f"```python")
-                lines.append(f"@staticmethod")
-                lines.append(f"def {method['name']}({params_str})")
-                lines.append(f"```")
-            elif method["is_classmethod"]:
-                lines.append(f"```python")
-                lines.append(f"@classmethod")
-                lines.append(f"def {method['name']}(cls, {params_str.replace('cls, ', '')})")
-                lines.append(f"```")
-            else:
-                lines.append(f"```python")
-                # Handle the case where params_str is empty or just "self"
-                if not params_str or params_str == "self":
-                    lines.append(f"def {method['name']}(self)")
-                else:
-                    lines.append(f"def {method['name']}(self, {params_str.replace('self, ', '')})")
-                lines.append(f"```")
-            lines.append("")
-            
-            # Add description
-            if method["docstring"]["description"]:
-                lines.append(method["docstring"]["description"])
-                lines.append("")
-            
-            # Add parameters (skip self/cls)
-            method_params = [p for p in method["docstring"]["params"] if p["name"] not in ("self", "cls")]
-            if method_params:
-                lines.append("**Parameters:**")
-                lines.append("")
-                
-                # Get the actual parameter types from the method signature
-                param_annotations = {}
-                for method_param in method["params"]:
-                    if method_param["annotation"]:
-                        param_annotations[method_param["name"]] = method_param["annotation"]
-                
-                # Process each parameter individually and ensure proper formatting
-                for i, param in enumerate(method_params):
-                    param_name = param['name']
-                    
-                    # Use type from annotation if available, then from docstring, or 'Any' as fallback
-                    param_type = "Any"
-                    if param_name in param_annotations:
-                        param_type = param_annotations[param_name]
-                    elif param.get("type"):
-                        param_type = param.get("type")
-                    
-                    # Get description, default to empty string
-                    description = param.get("description", "Parameter description not provided")
+                        write(f"{method_line}\n")
                     
-                    # Create a properly formatted parameter line
-                    # Ensure each parameter is on its own line with correct type annotation
-                    param_line = f"- `{param_name}` (`{param_type}`): {description.split('\n')[0]}"
-                    lines.append(param_line)
-                    
-                    # Add additional lines of description with proper indentation
-                    if '\n' in description:
-                        for line in description.split('\n')[1:]:
-                            if line.strip():
-                                lines.append(f"  {line.strip()}")
-                    
-                    # If there are more parameters following, add a newline between parameters
-                    if i < len(method_params) - 1:
-                        lines.append("")
-                
-                lines.append("")
-            
-            # Add return value
-            if method["docstring"]["returns"]:
-                lines.append("**Returns:**")
-                lines.append("")
-                
-                return_doc = method["docstring"]["returns"]
-                return_line = "- "
-                
-                # Use return type from annotation if available, then from docstring, or 'Any' as fallback
-                return_type = "Any"
-                if method.get("return_annotation"):
-                    return_type = method["return_annotation"]
-                elif return_doc and return_doc.get("type"):
-                    return_type = return_doc.get("type")
-                    
-                return_line += f"`{return_type}`: "
-                
-                if return_doc and return_doc.get("description"):
-                    return_line += return_doc["description"]
-                else:
-                    return_line += "Return value description not provided"
-                
-                lines.append(return_line)
-                lines.append("")
-            
-            # Add exceptions
-            if method["docstring"]["raises"]:
-                lines.append("**Raises:**")
-                lines.append("")
-                
-                for exception in method["docstring"]["raises"]:
-                    exception_line = f"- `{exception['type']}`"
-                    if exception.get("description"):
-                        exception_line += f": {exception['description']}"
-                    lines.append(exception_line)
-                
-                lines.append("")
-            
-            # Add examples
-            if method["docstring"]["examples"]:
-                lines.append("**Examples:**")
-                lines.append("")
-                
-                for example in method["docstring"]["examples"]:
-                    lines.append("```python")
-                    lines.append(example.strip())
-                    lines.append("```")
-                    lines.append("")
+                    write("\n")
         
-        return lines
\ No newline at end of file
+        # Add detailed method documentation for this class's methods,
+        # skipping the constructor, which was already documented
+        for method in chain(regular_methods, special_methods):
+            self._generate_function_documentation(method, write, is_method=True)
+
+
+def _render_file(item: Tuple[str, Dict[str, Any]]) -> Tuple[str, str]:
+    """
+    Render the documentation body for one file. Defined at module level so worker processes can unpickle it.
+    
+    Args:
+        item: Tuple of (source file path, parsed file information)
+    
+    Returns:
+        Tuple of (source file path, markdown content without the title line)
+    """
+    file_path, file_info = item
+    return file_path, DocumentationGenerator({})._generate_file_body(file_path, file_info)
@@ -2,11 +2,16 @@
 Gherkin generator module for converting callable docstrings into Gherkin feature files.
 """
 
+import asyncio
+import functools
 import hashlib
 import inspect
 import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
-from typing import Dict, Any, Callable, Optional, Tuple, List
+from typing import Dict, Any, Callable, Iterator, Optional, Tuple, List
 
 try:
     from openai import OpenAI
@@ -14,6 +19,97 @@ except ImportError:
     OpenAI = None
 
 
+@dataclass(slots=True, frozen=True)
+class GherkinMetadata:
+    """
+    Metadata about a Gherkin generation.
+    
+    Fields are read as attributes, or by key like a dictionary for compatibility
+    with code written against the old metadata dictionary.
+    
+    Attributes:
+        feature_name: Name of the feature
+        feature_file_path: Path where file should be written, or None if no path was given
+        creation_timestamp: ISO format timestamp of generation
+        callable_name: Name of the callable
+        callable_signature: Signature of the callable
+        num_scenarios: Number of scenarios generated
+        content_hash: SHA256 hash of the content
+        has_examples: Whether examples were included
+        has_parameters: Whether parameters were documented
+        has_return: Whether return value was documented
+        content_length: Length of the content in characters
+        description: First 100 characters of the description
+        llm_iterations: Number of LLM refinement iterations used
+        error: Error message if generation failed, otherwise None
+    """
+    feature_name: str
+    feature_file_path: Optional[str]
+    creation_timestamp: str
+    callable_name: str
+    callable_signature: str
+    num_scenarios: int
+    content_hash: str
+    has_examples: bool
+    has_parameters: bool
+    has_return: bool
+    content_length: int
+    description: str
+    llm_iterations: int
+    error: Optional[str] = None
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: object) -> bool:
+        # error is only present when generation failed, as in the old dictionary
+        if key == "error":
+            return self.error is not None
+        return key in _METADATA_FIELDS
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+    
+    def keys(self) -> List[str]:
+        """
+        Get the names of the fields that are present.
+        
+        Returns:
+            List of field names, in declaration order
+        """
+        return [name for name in _METADATA_FIELDS if name in self]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a field by name, like dict.get.
+        
+        Args:
+            key: Field name
+            default: Value to return if the field is not present
+        
+        Returns:
+            The field's value, or default
+        """
+        return getattr(self, key) if key in self else default
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the metadata to a dictionary of the fields that are present.
+        
+        Returns:
+            Dictionary of field names to values
+        """
+        metadata = asdict(self)
+        if self.error is None:
+            del metadata["error"]
+        return metadata
+
+
+_METADATA_FIELDS: Tuple[str, ...] = tuple(field.name for field in fields(GherkinMetadata))
+
+
 class GherkinGenerator:
     """
     Generate Gherkin feature files from callable docstrings using LLM-powered generation.
@@ -21,14 +117,37 @@ class GherkinGenerator:
     This class uses OpenAI's API to generate clear, specific, and verifiable Gherkin scenarios
     with an iterative refinement loop to ensure quality.
     """
+    # Default location of the on-disk cache of generated Gherkin
+    DEFAULT_CACHE_DIR: str = os.path.join(os.path.expanduser("~"), ".cache", "gherkin_gen")
+    # Model that writes the feature header, background and scenarios
+    GENERATION_MODEL: str = "gpt-4"
+    # Model that reviews scenarios for clarity and gives editor feedback
+    REVIEW_MODEL: str = "gpt-3.5-turbo"
+    # Bump when prompts or the cached format change, so stale cache entries are no longer matched.
+    # The model names are part of the cache key themselves.
+    CACHE_FORMAT_VERSION: int = 1
+    # Set to "0" to fail on missing replay fixtures instead of recording them
+    RECORD_ENV_VAR: str = "GHERKIN_RECORD"
     
-    def __init__(self, api_key: Optional[str] = None, max_iterations: int = 3):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_iterations: int = 3,
+        cache_dir: Optional[str] = None,
+        use_cache: bool = False,
+        replay_fixtures_dir: Optional[str] = None
+    ):
         """
         Initialize the Gherkin generator with OpenAI API configuration.
         
         Args:
             api_key: OpenAI API key. If None, will try to use OPENAI_API_KEY environment variable.
             max_iterations: Maximum number of refinement iterations for each section (default: 3)
+            cache_dir: Directory for cached generations (default: ~/.cache/gherkin_gen)
+            use_cache: Whether to reuse and store generations on disk (default: False)
+            replay_fixtures_dir: Directory of recorded generations to replay, keyed by the
+                callable's qualified name and source. Missing recordings are generated and
+                recorded, unless the GHERKIN_RECORD environment variable is "0" (default: None)
             
         Raises:
             RuntimeError: If OpenAI package is not installed
@@ -41,6 +160,10 @@ class GherkinGenerator:
         
         self.api_key = api_key
         self.max_iterations = max_iterations
+        self.cache_dir = cache_dir or self.DEFAULT_CACHE_DIR
+        self.use_cache = use_cache
+        self.replay_fixtures_dir = replay_fixtures_dir
+        self.record = os.environ.get(self.RECORD_ENV_VAR, "1") != "0"
         self.client = OpenAI(api_key=api_key) if api_key else OpenAI()
     
     def make_gherkins(
@@ -48,7 +171,7 @@ class GherkinGenerator:
         callable_obj: Callable,
         docstring: Optional[str] = None,
         output_path: Optional[str] = None
-    ) -> Tuple[str, Dict[str, Any]]:
+    ) -> Tuple[str, GherkinMetadata]:
         """
         Generate a Gherkin feature file from a callable's docstring using LLM-powered generation.
         
@@ -64,7 +187,7 @@ class GherkinGenerator:
         Returns:
             Tuple containing:
                 - str: The generated Gherkin feature file content (or error message on failure)
-                - Dict[str, Any]: Metadata dictionary with information about the generation
+                - GherkinMetadata: Metadata with information about the generation
                     - feature_name: Name of the feature
                     - feature_file_path: Path where file should be written
                     - creation_timestamp: ISO format timestamp of generation
@@ -80,6 +203,7 @@ class GherkinGenerator:
                     
         Raises:
             ValueError: If callable_obj is not a valid callable
+            FileNotFoundError: If replaying, recording is disabled and there is no recording
             
         Examples:
             >>> generator = GherkinGenerator(api_key="sk-...")
@@ -102,6 +226,19 @@ class GherkinGenerator:
         if not callable(callable_obj):
             raise ValueError(f"{callable_obj} is not a callable object")
         
+        # Replay a recorded generation without parsing the docstring at all
+        replay_key = None
+        if self.replay_fixtures_dir is not None:
+            replay_key = self._replay_key(callable_obj, docstring, output_path)
+            replayed = self._load_cached(replay_key, self.replay_fixtures_dir)
+            if replayed is not None:
+                return replayed
+            if not self.record:
+                raise FileNotFoundError(
+                    f"No recorded generation for {callable_obj!r} in {self.replay_fixtures_dir} "
+                    f"and {self.RECORD_ENV_VAR}=0"
+                )
+        
         # Extract callable information
         callable_name = self._get_callable_name(callable_obj)
         callable_signature = self._get_callable_signature(callable_obj)
@@ -110,6 +247,14 @@ class GherkinGenerator:
         if docstring is None:
             docstring = inspect.getdoc(callable_obj) or ""
         
+        # Reuse a previous generation for the same inputs if caching is enabled
+        cache_key = None
+        if self.use_cache:
+            cache_key = self._cache_key(callable_name, callable_signature, docstring, output_path)
+            cached = self._load_cached(cache_key)
+            if cached is not None:
+                return cached
+        
         # Parse docstring structure
         parsed_doc = self._parse_docstring(docstring)
         
@@ -143,8 +288,200 @@ class GherkinGenerator:
             error=error_msg
         )
         
+        # Failed generations are not cached, so they are retried next time
+        if cache_key is not None and error_msg is None:
+            self._store_cached(cache_key, gherkin_content, metadata)
+        if replay_key is not None and error_msg is None:
+            self._store_cached(replay_key, gherkin_content, metadata, self.replay_fixtures_dir)
+        
         return gherkin_content, metadata
     
+    def generate_many(self, callables: List[Callable]) -> List[Tuple[str, GherkinMetadata]]:
+        """
+        Generate Gherkin feature files for several callables with this generator.
+        
+        All generations share this generator's OpenAI client, so its HTTP
+        connections are reused instead of being set up again for every callable.
+        
+        Args:
+            callables: Callable objects to document
+        
+        Returns:
+            List of (gherkin_content, metadata) tuples, in the same order as callables
+        
+        Raises:
+            ValueError: If any item is not a valid callable
+        """
+        return [self.make_gherkins(callable_obj) for callable_obj in callables]
+    
+    async def amake_gherkins(
+        self,
+        callable_obj: Callable,
+        docstring: Optional[str] = None,
+        output_path: Optional[str] = None
+    ) -> Tuple[str, GherkinMetadata]:
+        """
+        Generate a Gherkin feature file without blocking the event loop.
+        
+        The generation runs make_gherkins in a worker thread, so the event loop
+        keeps running while the OpenAI requests are in flight.
+        
+        Args:
+            callable_obj: The callable object (function, method, or class) to document
+            docstring: Optional docstring to use instead of extracting from callable
+            output_path: Optional path where the feature file should be written
+        
+        Returns:
+            Tuple of (gherkin_content, metadata), as returned by make_gherkins
+        
+        Raises:
+            ValueError: If callable_obj is not a valid callable
+        """
+        return await asyncio.to_thread(self.make_gherkins, callable_obj, docstring, output_path)
+    
+    async def agenerate_many(
+        self,
+        callables: List[Callable],
+        concurrency: int = 10
+    ) -> List[Tuple[str, GherkinMetadata]]:
+        """
+        Generate Gherkin feature files for several callables concurrently.
+        
+        Args:
+            callables: Callable objects to document
+            concurrency: Maximum number of generations in flight at once (default: 10)
+        
+        Returns:
+            List of (gherkin_content, metadata) tuples, in the same order as callables
+        
+        Raises:
+            ValueError: If any item is not a valid callable
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def generate_one(callable_obj: Callable) -> Tuple[str, GherkinMetadata]:
+            async with semaphore:
+                return await self.amake_gherkins(callable_obj)
+        
+        return list(await asyncio.gather(*(generate_one(callable_obj) for callable_obj in callables)))
+    
+    def _cache_key(
+        self,
+        callable_name: str,
+        callable_signature: str,
+        docstring: str,
+        output_path: Optional[str]
+    ) -> str:
+        """
+        Compute the cache key for a generation.
+        
+        Args:
+            callable_name: Name of the callable
+            callable_signature: Signature of the callable
+            docstring: Docstring the Gherkin is generated from
+            output_path: Optional output path, which is recorded in the metadata
+        
+        Returns:
+            Hex SHA-256 digest identifying the generation inputs
+        """
+        parts = [
+            str(self.CACHE_FORMAT_VERSION),
+            self.GENERATION_MODEL,
+            self.REVIEW_MODEL,
+            callable_name,
+            callable_signature,
+            docstring,
+            str(self.max_iterations),
+            output_path or "",
+        ]
+        return hashlib.sha256("\0".join(parts).encode('utf-8')).hexdigest()
+    
+    def _replay_key(
+        self,
+        callable_obj: Callable,
+        docstring: Optional[str],
+        output_path: Optional[str]
+    ) -> str:
+        """
+        Compute the replay fixture key for a generation.
+        
+        Args:
+            callable_obj: The callable being documented
+            docstring: Optional docstring overriding the callable's own
+            output_path: Optional output path, which is recorded in the metadata
+        
+        Returns:
+            Hex SHA-256 digest of the callable's qualified name and source
+        """
+        try:
+            source = inspect.getsource(callable_obj)
+        except (OSError, TypeError):
+            source = ""
+        parts = [
+            getattr(callable_obj, '__qualname__', type(callable_obj).__qualname__),
+            source,
+            docstring or "",
+            output_path or "",
+        ]
+        return hashlib.sha256("\0".join(parts).encode('utf-8')).hexdigest()
+    
+    def _load_cached(
+        self,
+        cache_key: str,
+        directory: Optional[str] = None
+    ) -> Optional[Tuple[str, GherkinMetadata]]:
+        """
+        Load a cached generation.
+        
+        Args:
+            cache_key: Key returned by _cache_key or _replay_key
+            directory: Directory holding the entry (default: the cache directory)
+        
+        Returns:
+            Tuple of (gherkin_content, metadata), or None if there is no usable entry
+        """
+        directory = directory or self.cache_dir
+        try:
+            with open(os.path.join(directory, f"{cache_key}.json"), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            return entry["content"], GherkinMetadata(**entry["metadata"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _store_cached(
+        self,
+        cache_key: str,
+        gherkin_content: str,
+        metadata: GherkinMetadata,
+        directory: Optional[str] = None
+    ) -> None:
+        """
+        Store a generation in the cache.
+        
+        The entry is written to a temporary file and moved into place, so
+        concurrent readers never see a partially written entry.
+        
+        Args:
+            cache_key: Key returned by _cache_key or _replay_key
+            gherkin_content: Generated Gherkin content
+            metadata: Metadata for the generation
+            directory: Directory to store the entry in (default: the cache directory)
+        """
+        directory = directory or self.cache_dir
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({"content": gherkin_content, "metadata": metadata.to_dict()}, f)
+                os.replace(tmp_path, os.path.join(directory, f"{cache_key}.json"))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # The cache is only an optimization; a failed write must not fail generation
+            pass
+    
     @staticmethod
     def _get_callable_name(callable_obj: Callable) -> str:
         """
@@ -181,10 +518,14 @@ class GherkinGenerator:
             return "()"
     
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _parse_docstring(docstring: str) -> Dict[str, Any]:
         """
         Parse docstring into structured components.
         
+        Results are cached by docstring text, so the same dictionary is shared by
+        every call with that docstring and must not be modified.
+        
         Args:
             docstring: The docstring text
             
@@ -208,13 +549,15 @@ class GherkinGenerator:
         result = {
             "description": [],
             "parameters": [],
-            "returns": "",
+            "returns": [],
             "examples": [],
             "raises": []
         }
         
+        # Multi-line descriptions are collected as lists and joined once at the end
+        param_descriptions: List[List[str]] = []
         current_section = "description"
-        current_param = None
+        current_param_description = None
         
         for line in lines:
             stripped = line.strip()
@@ -242,13 +585,14 @@ class GherkinGenerator:
                     parts = stripped.split(':', 1)
                     param_name = parts[0].strip()
                     param_desc = parts[1].strip() if len(parts) > 1 else ""
-                    current_param = {"name": param_name, "description": param_desc}
-                    result["parameters"].append(current_param)
-                elif current_param and stripped:
+                    current_param_description = [param_desc]
+                    param_descriptions.append(current_param_description)
+                    result["parameters"].append({"name": param_name, "description": param_desc})
+                elif current_param_description is not None and stripped:
                     # Continue description of current parameter
-                    current_param["description"] += " " + stripped
+                    current_param_description.append(stripped)
             elif current_section == "returns" and stripped:
-                result["returns"] += " " + stripped if result["returns"] else stripped
+                result["returns"].append(stripped)
             elif current_section == "examples" and stripped:
                 result["examples"].append(stripped)
             elif current_section == "raises" and stripped:
@@ -256,6 +600,9 @@ class GherkinGenerator:
         
         # Join description lines
         result["description"] = " ".join(result["description"])
+        result["returns"] = " ".join(result["returns"])
+        for param, description in zip(result["parameters"], param_descriptions):
+            param["description"] = " ".join(description)
         
         return result
     
@@ -401,7 +748,7 @@ Output only the feature header in valid Gherkin format."""
         
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4",
+                model=self.GENERATION_MODEL,
                 messages=[
                     {"role": "system", "content": "You are an expert at writing clear, specific Gherkin scenarios that describe unambiguous, verifiable external behavior."},
                     {"role": "user", "content": prompt}
@@ -441,7 +788,7 @@ Output only the Background section in valid Gherkin format."""
         
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4",
+                model=self.GENERATION_MODEL,
                 messages=[
                     {"role": "system", "content": "You are an expert at writing clear, specific Gherkin scenarios."},
                     {"role": "user", "content": prompt}
@@ -532,7 +879,7 @@ Output only the Background section in valid Gherkin format."""
         
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4",
+                model=self.GENERATION_MODEL,
                 messages=[
                     {"role": "system", "content": "You are an expert at writing clear, specific Gherkin scenarios that describe unambiguous, verifiable external behavior. Avoid vague terms like 'executes successfully' - instead specify concrete, observable outcomes like 'returns a dictionary with keys: status, data'."},
                     {"role": "user", "content": prompt}
@@ -577,7 +924,7 @@ If there are no issues, set is_clear to true and issues to empty list."""
         
         try:
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=self.REVIEW_MODEL,
                 messages=[
                     {"role": "system", "content": "You are a Gherkin quality classifier. You identify vague or ambiguous scenarios and require concrete, verifiable assertions."},
                     {"role": "user", "content": prompt}
@@ -621,7 +968,7 @@ Output your feedback as a list of specific improvements."""
         
         try:
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
+                model=self.REVIEW_MODEL,
                 messages=[
                     {"role": "system", "content": "You are a Gherkin editor who provides specific, actionable feedback to improve scenario clarity."},
                     {"role": "user", "content": prompt}
@@ -678,7 +1025,7 @@ Generate an improved version with concrete, verifiable assertions."""
         
         try:
             response = self.client.chat.completions.create(
-                model="gpt-4",
+                model=self.GENERATION_MODEL,
                 messages=[
                     {"role": "system", "content": "You are an expert at writing clear, specific Gherkin scenarios. You always incorporate feedback to make scenarios more concrete and verifiable."},
                     {"role": "user", "content": enhanced_prompt}
@@ -770,9 +1117,9 @@ Output only the Scenario in valid Gherkin format with concrete verification step
         output_path: Optional[str] = None,
         llm_iterations: int = 0,
         error: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> GherkinMetadata:
         """
-        Generate metadata dictionary about the Gherkin generation.
+        Generate metadata about the Gherkin generation.
         
         Args:
             feature_name: Name of the feature
@@ -785,7 +1132,7 @@ Output only the Scenario in valid Gherkin format with concrete verification step
             error: Error message if generation failed
             
         Returns:
-            Metadata dictionary
+            GherkinMetadata for the generation
         """
         # Calculate content hash
         content_hash = hashlib.sha256(gherkin_content.encode('utf-8')).hexdigest()
@@ -801,26 +1148,22 @@ Output only the Scenario in valid Gherkin format with concrete verification step
         # Generate timestamp
         timestamp = datetime.now().isoformat()
         
-        metadata = {
-            "feature_name": feature_name,
-            "feature_file_path": output_path,
-            "creation_timestamp": timestamp,
-            "callable_name": callable_name,
-            "callable_signature": callable_signature,
-            "num_scenarios": num_scenarios,
-            "content_hash": content_hash,
-            "has_examples": len(parsed_doc.get("examples", [])) > 0,
-            "has_parameters": len(parsed_doc.get("parameters", [])) > 0,
-            "has_return": bool(parsed_doc.get("returns", "")),
-            "content_length": len(gherkin_content),
-            "description": parsed_doc.get("description", "")[:100],  # First 100 chars
-            "llm_iterations": llm_iterations
-        }
-        
-        if error:
-            metadata["error"] = error
-        
-        return metadata
+        return GherkinMetadata(
+            feature_name=feature_name,
+            feature_file_path=output_path,
+            creation_timestamp=timestamp,
+            callable_name=callable_name,
+            callable_signature=callable_signature,
+            num_scenarios=num_scenarios,
+            content_hash=content_hash,
+            has_examples=len(parsed_doc.get("examples", [])) > 0,
+            has_parameters=len(parsed_doc.get("parameters", [])) > 0,
+            has_return=bool(parsed_doc.get("returns", "")),
+            content_length=len(gherkin_content),
+            description=parsed_doc.get("description", "")[:100],  # First 100 chars
+            llm_iterations=llm_iterations,
+            error=error or None
+        )
 
 
 def make_gherkins(
@@ -828,8 +1171,11 @@ def make_gherkins(
     docstring: Optional[str] = None,
     output_path: Optional[str] = None,
     api_key: Optional[str] = None,
-    max_iterations: int = 3
-) -> Tuple[str, Dict[str, Any]]:
+    max_iterations: int = 3,
+    use_cache: bool = False,
+    cache_dir: Optional[str] = None,
+    replay_fixtures_dir: Optional[str] = None
+) -> Tuple[str, GherkinMetadata]:
     """
     Generate a Gherkin feature file from a callable's docstring using LLM-powered generation.
     
@@ -843,15 +1189,19 @@ def make_gherkins(
         output_path: Optional path where the feature file should be written
         api_key: OpenAI API key. If None, will try to use OPENAI_API_KEY environment variable.
         max_iterations: Maximum number of refinement iterations for each section (default: 3)
+        use_cache: Whether to reuse and store generations on disk (default: False)
+        cache_dir: Directory for cached generations (default: ~/.cache/gherkin_gen)
+        replay_fixtures_dir: Directory of recorded generations to replay (default: None)
         
     Returns:
         Tuple containing:
             - str: The generated Gherkin feature file content (or error message on failure)
-            - Dict[str, Any]: Metadata dictionary with information about the generation
+            - GherkinMetadata: Metadata with information about the generation
             
     Raises:
         ValueError: If callable_obj is not a valid callable
         RuntimeError: If OpenAI package is not installed
+        FileNotFoundError: If replaying, recording is disabled and there is no recording
         
     Examples:
         >>> def example_function(x: int) -> int:
@@ -868,5 +1218,94 @@ def make_gherkins(
         >>> assert 'Feature:' in content
         >>> assert metadata['callable_name'] == 'example_function'
     """
-    generator = GherkinGenerator(api_key=api_key, max_iterations=max_iterations)
+    generator = GherkinGenerator(
+        api_key=api_key,
+        max_iterations=max_iterations,
+        cache_dir=cache_dir,
+        use_cache=use_cache,
+        replay_fixtures_dir=replay_fixtures_dir
+    )
     return generator.make_gherkins(callable_obj, docstring, output_path)
+
+
+def make_gherkins_batch(
+    callables: List[Callable],
+    api_key: Optional[str] = None,
+    max_iterations: int = 3,
+    use_cache: bool = False,
+    cache_dir: Optional[str] = None,
+    replay_fixtures_dir: Optional[str] = None
+) -> List[Tuple[str, GherkinMetadata]]:
+    """
+    Generate Gherkin feature files for several callables' docstrings.
+    
+    Unlike calling make_gherkins once per callable, a single GherkinGenerator
+    and OpenAI client are shared by the whole batch.
+    
+    Args:
+        callables: Callable objects (functions, methods, or classes) to document
+        api_key: OpenAI API key. If None, will try to use OPENAI_API_KEY environment variable.
+        max_iterations: Maximum number of refinement iterations for each section (default: 3)
+        use_cache: Whether to reuse and store generations on disk (default: False)
+        cache_dir: Directory for cached generations (default: ~/.cache/gherkin_gen)
+        replay_fixtures_dir: Directory of recorded generations to replay (default: None)
+    
+    Returns:
+        List of (gherkin_content, metadata) tuples, in the same order as callables
+    
+    Raises:
+        ValueError: If any item is not a valid callable
+        RuntimeError: If OpenAI package is not installed
+        FileNotFoundError: If replaying, recording is disabled and a recording is missing
+    """
+    generator = GherkinGenerator(
+        api_key=api_key,
+        max_iterations=max_iterations,
+        cache_dir=cache_dir,
+        use_cache=use_cache,
+        replay_fixtures_dir=replay_fixtures_dir
+    )
+    return generator.generate_many(callables)
+
+
+async def make_gherkins_async(
+    callables: List[Callable],
+    api_key: Optional[str] = None,
+    max_iterations: int = 3,
+    concurrency: int = 10,
+    use_cache: bool = False,
+    cache_dir: Optional[str] = None,
+    replay_fixtures_dir: Optional[str] = None
+) -> List[Tuple[str, GherkinMetadata]]:
+    """
+    Generate Gherkin feature files for several callables' docstrings concurrently.
+    
+    Like make_gherkins_batch, a single GherkinGenerator and OpenAI client are
+    shared by every generation, but up to concurrency generations run at once,
+    so their API round trips overlap.
+    
+    Args:
+        callables: Callable objects (functions, methods, or classes) to document
+        api_key: OpenAI API key. If None, will try to use OPENAI_API_KEY environment variable.
+        max_iterations: Maximum number of refinement iterations for each section (default: 3)
+        concurrency: Maximum number of generations in flight at once (default: 10)
+        use_cache: Whether to reuse and store generations on disk (default: False)
+        cache_dir: Directory for cached generations (default: ~/.cache/gherkin_gen)
+        replay_fixtures_dir: Directory of recorded generations to replay (default: None)
+    
+    Returns:
+        List of (gherkin_content, metadata) tuples, in the same order as callables
+    
+    Raises:
+        ValueError: If any item is not a valid callable
+        RuntimeError: If OpenAI package is not installed
+        FileNotFoundError: If replaying, recording is disabled and a recording is missing
+    """
+    generator = GherkinGenerator(
+        api_key=api_key,
+        max_iterations=max_iterations,
+        cache_dir=cache_dir,
+        use_cache=use_cache,
+        replay_fixtures_dir=replay_fixtures_dir
+    )
+    return await generator.agenerate_many(callables, concurrency=concurrency)
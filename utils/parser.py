@@ -746,14 +746,41 @@ class CodeParser:
         
         # Second pass: Resolve inheritance for all classes if enabled
         if resolve_inheritance:
-            for cls in result["classes"]:
-                self._resolve_inheritance(cls)
-            
-            if len(result["classes"]) > 0 and len(self.parsed_classes) > 0:
-                logger.debug(f"Resolved inheritance for {len(result['classes'])} classes")
+            self._resolve_file_inheritance(result)
         
         return result
     
+    def add_parsed_file(self, result: Dict[str, Any], resolve_inheritance: bool = True) -> None:
+        """
+        Register the classes of a file that was parsed by another CodeParser.
+        
+        Files parsed in worker processes are parsed with resolve_inheritance=False
+        and then added here in their original order, which resolves inheritance
+        exactly as if they had been parsed by this parser one after another.
+        
+        Args:
+            result: Parsed file information returned by parse()
+            resolve_inheritance: Whether to enable enhanced inheritance documentation
+        """
+        for class_info in result["classes"]:
+            self.parsed_classes[class_info["name"]] = class_info
+        
+        if resolve_inheritance:
+            self._resolve_file_inheritance(result)
+    
+    def _resolve_file_inheritance(self, result: Dict[str, Any]) -> None:
+        """
+        Resolve inheritance for every class in a parsed file.
+        
+        Args:
+            result: Parsed file information whose classes are already registered
+        """
+        for cls in result["classes"]:
+            self._resolve_inheritance(cls)
+        
+        if len(result["classes"]) > 0 and len(self.parsed_classes) > 0:
+            logger.debug(f"Resolved inheritance for {len(result['classes'])} classes")
+    
     def _parse_function(self, node: ast.FunctionDef, docstring_parser: DocstringParser) -> Dict[str, Any]:
         """
         Parse a function node to extract its signature and docstring.
@@ -1125,4 +1152,4 @@ class CodeParser:
             if base_name not in mro:
                 mro.append(base_name)
         
-        return mro
\ No newline at end of file
+        return mro
@@ -2,15 +2,24 @@
 Output writer module for the documentation generator.
 """
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Mapping, Set, Tuple, Union
 
 
 class OutputWriter:
     """
     Write generated documentation to output files.
     """
+    # Files smaller than this are written with one os.write() call, bypassing Python's file objects.
+    SMALL_FILE_LIMIT: int = 64 * 1024
+    # Buffer size for larger files, so each one is flushed in as few write(2) calls as possible.
+    WRITE_BUFFER_SIZE: int = 1 << 20
+    # Number of threads writing files concurrently.
+    MAX_WRITE_WORKERS: int = 32
+    # Pages waiting to be written before the writer stops pulling from its input.
+    MAX_PENDING_WRITES: int = 64
     
     def __init__(self, output_dir: str):
         """
@@ -26,48 +35,100 @@ class OutputWriter:
         if not self.output_dir.exists():
             self.output_dir.mkdir(parents=True, exist_ok=True)
 
-    def write(self, documentation: Dict[str, str]) -> None:
+    def write(self, documentation: Union[Mapping[str, str], Iterable[Tuple[str, str]]]) -> None:
         """
         Write documentation to output files.
         
+        Pages are written as they are pulled from the input, so an iterator
+        such as DocumentationGenerator.iter_generate() is never fully buffered.
+        
         Args:
-            documentation: Dictionary of file paths to document content
+            documentation: Dictionary of file paths to document content, or an
+                iterable of (file path, document content) pairs
         """
+        if isinstance(documentation, Mapping):
+            documentation = documentation.items()
+        
         # Track existing files to avoid unnecessary overwrites
         existing_files = set()
         for path in self.output_dir.rglob('*'):
             if path.is_file():
                 existing_files.add(path)
 
-        # Write each file
-        for file_path, content in documentation.items():
-            # Convert string path to Path object
-            output_path = self.output_dir / Path(file_path)
+        # Writes are I/O-bound, so threads can overlap them
+        created_dirs = set()
+        pending = set()
+        last_writes: Dict[Path, Future] = {}
+        with ThreadPoolExecutor(max_workers=self.MAX_WRITE_WORKERS) as executor:
+            for file_path, content in documentation:
+                # Convert string path to Path object
+                output_path = self.output_dir / Path(file_path)
 
-            # If "docs/docs/" is somewhere in the path, replace it with "docs/".
-            if "docs/docs/" in str(output_path):
-                output_path = Path(str(output_path).replace("docs/docs/", "docs/"))
+                # If "docs/docs/" is somewhere in the path, replace it with "docs/".
+                if "docs/docs/" in str(output_path):
+                    output_path = Path(str(output_path).replace("docs/docs/", "docs/"))
             
-            # Ensure directory structure exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+                # Ensure directory structure exists, creating each directory only once
+                if output_path.parent not in created_dirs:
+                    os.makedirs(output_path.parent, exist_ok=True)
+                    created_dirs.add(output_path.parent)
 
-            # Check if file exists and content is the same
-            if output_path in existing_files:
-                try:
-                    existing_content = output_path.read_text(encoding='utf-8')
-                    
-                    # Skip writing if content hasn't changed
-                    if existing_content == content:
-                        continue
-                except (IOError, UnicodeDecodeError):
-                    # If we can't read the file, overwrite it
-                    pass
+                # Stop pulling pages while too many are waiting to be written
+                if len(pending) >= self.MAX_PENDING_WRITES:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        # Re-raise exceptions from workers
+                        future.result()
+        
+                # Pages for the same path are written one after another, so the last one wins
+                previous = last_writes.get(output_path)
+                if previous is not None:
+                    previous.result()
+                future = executor.submit(self._write_one, (output_path, content), existing_files)
+                last_writes[output_path] = future
+                pending.add(future)
             
-            # Write content
-            output_path.write_text(content, encoding='utf-8')
+            for future in pending:
+                future.result()
         
         # Remove empty directories that may have been created in output_dir.
         for path in self.output_dir.rglob('*'):
             if path.is_dir() and not any(path.iterdir()):
                 path.rmdir()
                 print(f"Removed empty directory: {path}")
+
+    @staticmethod
+    def _write_one(item: Tuple[Path, str], existing_files: Set[Path]) -> None:
+        """
+        Write a single documentation file, skipping it if its content is unchanged.
+        
+        Args:
+            item: Tuple of (output path, document content)
+            existing_files: Files that already existed in the output directory
+        """
+        output_path, content = item
+        data = content.encode('utf-8')
+        
+        # Check if file exists and content is the same
+        if output_path in existing_files:
+            try:
+                # Skip writing if content hasn't changed
+                if output_path.read_bytes() == data:
+                    return
+            except IOError:
+                # If we can't read the file, overwrite it
+                pass
+        
+        # Write pre-encoded content, skipping the text-mode encoding layer
+        if len(data) < OutputWriter.SMALL_FILE_LIMIT:
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            fd = os.open(output_path, flags, 0o666)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+        else:
+            with open(output_path, 'wb', buffering=OutputWriter.WRITE_BUFFER_SIZE) as f:
+                f.write(data)